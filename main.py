@@ -11,6 +11,8 @@ from fastapi.responses import RedirectResponse
 
 from src.api.routes import extraction, health
 from src.core.config import settings
+from src.services.client_factory import get_client_factory
+from src.services.workflows.text_extraction_handler import shutdown_extraction_pool
 
 # Setup logging
 logging.basicConfig(
@@ -70,6 +72,8 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event."""
     logger.info("Shutting down Blackedge-OCR API server")
+    await get_client_factory().cleanup()
+    shutdown_extraction_pool()
 
 
 if __name__ == "__main__":
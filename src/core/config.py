@@ -41,6 +41,8 @@ class Settings(BaseSettings):
     DEFAULT_CHUNK_SIZE: int = Field(50, description="Default chunk size for processing (pages)")
     MAX_CONCURRENT_REQUESTS: int = Field(5, description="Maximum concurrent API requests")
     REQUEST_TIMEOUT: int = Field(120, description="Request timeout in seconds")
+    TEXT_EXTRACTION_BACKEND: str = Field("pdfplumber", description="PDF library for text extraction: pdfplumber, or pymupdf (AGPL-3.0, installed separately)")
+    TEXT_EXTRACTION_DETECT_TABLES: bool = Field(True, description="Detect and append tables in text extraction (the costliest step per page)")
 
     # Server Configuration
     HOST: str = Field("0.0.0.0", description="Server host")
@@ -33,7 +33,7 @@ class RateLimiter:
         rate_per_minute (int): Maximum requests per minute
         tokens (float): Current number of available tokens
         max_tokens (int): Maximum token capacity (same as rate)
-        last_update (float): Timestamp of last token replenishment
+        last_update (float): Monotonic timestamp of last token replenishment
 
     Example:
         limiter = RateLimiter(rate_per_minute=60)
@@ -55,7 +55,7 @@ class RateLimiter:
         self.rate_per_minute = rate_per_minute
         self.tokens = float(rate_per_minute)
         self.max_tokens = rate_per_minute
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
 
         logger.debug(
@@ -70,7 +70,7 @@ class RateLimiter:
         Calculates how many tokens should be added based on time elapsed
         since last update and adds them to the bucket (up to max capacity).
         """
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_update
 
         # Calculate tokens to add based on elapsed time
@@ -171,7 +171,7 @@ class RateLimiter:
         Useful for testing or manual rate limit resets.
         """
         self.tokens = float(self.max_tokens)
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
 
         logger.info(
             "RateLimiter reset",
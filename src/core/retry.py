@@ -13,7 +13,8 @@ Example:
 
 import asyncio
 import functools
-from typing import Callable, TypeVar, Any, Optional, Tuple, Type
+import random
+from typing import Callable, TypeVar, Any, Iterable, Optional, Tuple, Type, Union
 import httpx
 
 from src.core.logging import get_logger
@@ -32,7 +33,7 @@ class RetryConfig:
     Attributes:
         max_attempts: Maximum number of retry attempts (including first try)
         backoff_factor: Exponential backoff multiplier (in seconds)
-        retry_status_codes: HTTP status codes that trigger retry
+        retry_status_codes: HTTP status codes that trigger retry (tuple)
         retry_exceptions: Exception types that trigger retry
     """
 
@@ -62,10 +63,33 @@ class RetryConfig:
             httpx.ConnectError,
         )
 
+    @property
+    def retry_status_codes(self) -> Tuple[int, ...]:
+        """HTTP status codes that trigger retry (immutable, see the setter)."""
+        return self._retry_status_codes
+
+    @retry_status_codes.setter
+    def retry_status_codes(self, codes: Iterable[int]) -> None:
+        """
+        Set the retryable status codes and rebuild their bitmask.
+
+        Codes are stored as a tuple so they can't be mutated in place behind
+        the bitmask's back; assign a new collection to change them.
+        """
+        self._retry_status_codes = tuple(codes)
+
+        # Bit N set means status N is retryable; checked with one shift/AND
+        self._status_mask = 0
+        for code in self._retry_status_codes:
+            self._status_mask |= 1 << code
+
 
 def calculate_backoff(attempt: int, backoff_factor: float) -> float:
     """
-    Calculate exponential backoff delay.
+    Calculate exponential backoff delay with full jitter.
+
+    The delay is drawn uniformly from ``[0, backoff_factor * 2**attempt]`` so
+    that clients failing at the same moment do not all retry in lockstep.
 
     Args:
         attempt: Current attempt number (0-indexed)
@@ -75,27 +99,28 @@ def calculate_backoff(attempt: int, backoff_factor: float) -> float:
         float: Delay in seconds
 
     Example:
-        >>> calculate_backoff(0, 2)
-        2.0
-        >>> calculate_backoff(1, 2)
-        4.0
-        >>> calculate_backoff(2, 2)
-        8.0
+        >>> 0.0 <= calculate_backoff(0, 2) <= 2.0
+        True
+        >>> 0.0 <= calculate_backoff(2, 2) <= 8.0
+        True
     """
-    return backoff_factor * (2**attempt)
+    return random.uniform(0, backoff_factor * (2**attempt))
 
 
-def should_retry_status(status_code: int, retry_status_codes: list) -> bool:
+def should_retry_status(status_code: int, retry_status_codes: Union[list, int]) -> bool:
     """
     Determine if HTTP status code should trigger retry.
 
     Args:
         status_code: HTTP status code
-        retry_status_codes: List of status codes that should trigger retry
+        retry_status_codes: List of status codes that should trigger retry, or
+                           an int bitmask with bit N set for each retryable code
 
     Returns:
         bool: True if should retry, False otherwise
     """
+    if isinstance(retry_status_codes, int):
+        return bool((retry_status_codes >> status_code) & 1)
     return status_code in retry_status_codes
 
 
@@ -125,7 +150,7 @@ async def retry_async(
 
             # Check if result is an httpx Response with retry-able status
             if isinstance(result, httpx.Response):
-                if should_retry_status(result.status_code, config.retry_status_codes):
+                if should_retry_status(result.status_code, config._status_mask):
                     if attempt < config.max_attempts - 1:
                         delay = calculate_backoff(attempt, config.backoff_factor)
 
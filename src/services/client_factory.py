@@ -254,7 +254,8 @@ class ClientFactory:
             cleanup_count += 1
 
         if self._gemini_client is not None:
-            # Gemini client doesn't need explicit cleanup
+            # Gemini client holds a pooled HTTP client that must be closed
+            await self._gemini_client.aclose()
             self._gemini_client = None
             cleanup_count += 1
 
@@ -289,7 +290,9 @@ class ClientFactory:
         """
         Reset factory by clearing all clients.
 
-        Useful for testing or forcing re-initialization.
+        Useful for testing or forcing re-initialization. Clients are dropped,
+        not closed: cleanup() is the only path that closes the Gemini client's
+        pooled HTTP connections, so await it first if clients may be active.
         """
         logger.warning("Resetting client factory - all clients will be cleared")
 
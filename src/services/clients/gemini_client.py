@@ -10,13 +10,15 @@ Example:
             "document.pdf",
             "Extract all data"
         )
+    await client.aclose()  # Standalone clients close their own pool
 """
 
 import time
+import asyncio
+import httpx
 from typing import List, Dict, Any, Optional
 
 from src.services.clients.base_client import BaseDocumentClient
-from src.core.http_client import HTTPClient
 from src.core.retry import RetryableHTTPClient, RetryConfig
 from src.core.rate_limiter import get_provider_limiter
 from src.core.error_handling import (
@@ -30,6 +32,22 @@ from src.models.workflow_models import ExtractedSection
 logger = get_logger(__name__)
 
 
+def _read_page_texts(pdf_path: str) -> List[str]:
+    """
+    Open a PDF, read every page's text and close it, in a worker thread.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        List[str]: Text of each page, in page order
+    """
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
 class GeminiClient(BaseDocumentClient):
     """
     Google Gemini document processing client.
@@ -41,6 +59,7 @@ class GeminiClient(BaseDocumentClient):
         api_key (str): Google Gemini API key
         model (str): Gemini model to use
         api_base (str): API base URL
+        _http (httpx.AsyncClient): Pooled HTTP client shared across requests
     """
 
     def __init__(
@@ -49,6 +68,7 @@ class GeminiClient(BaseDocumentClient):
         model: str = "gemini-pro",
         api_base: str = "https://generativelanguage.googleapis.com/v1beta",
         timeout: float = 120.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize Gemini client.
@@ -58,6 +78,8 @@ class GeminiClient(BaseDocumentClient):
             model: Gemini model to use
             api_base: API base URL
             timeout: Request timeout in seconds
+            http_client: Optional shared httpx client (a pooled one is created
+                        if not provided)
         """
         from src.core.config import settings
 
@@ -71,6 +93,23 @@ class GeminiClient(BaseDocumentClient):
         # Rate limiter
         self.rate_limiter = get_provider_limiter().get("gemini")
 
+        # Request target and headers are fixed for the client's lifetime
+        self._endpoint = f"{self.api_base}/models/{self.model}:generateContent"
+        self._params = {"key": self.api_key}
+        self._headers = {"Content-Type": "application/json"}
+
+        # Pooled HTTP client reused across pages so connections stay alive.
+        # Only a client created here is ours to close.
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            follow_redirects=True,
+        )
+        self._retry_client = RetryableHTTPClient(
+            self._http, config=RetryConfig(max_attempts=3, backoff_factor=2)
+        )
+
     def _validate_credentials(self):
         """Validate that required credentials are present."""
         if not self.api_key:
@@ -104,56 +143,51 @@ class GeminiClient(BaseDocumentClient):
 
         # Rate limit
         async with self.rate_limiter:
-            # Make API request
-            async with HTTPClient(timeout=self.timeout) as http_client:
-                retry_client = RetryableHTTPClient(
-                    http_client, config=RetryConfig(max_attempts=3, backoff_factor=2)
-                )
-
-                try:
-                    response = await retry_client.post(
-                        url=f"{self.api_base}/models/{self.model}:generateContent?key={self.api_key}",
-                        json={
-                            "contents": [{"parts": [{"text": prompt}]}],
-                            "generationConfig": {
-                                "temperature": 0.1,
-                                "maxOutputTokens": 4000,
-                            },
+            try:
+                response = await self._retry_client.post(
+                    self._endpoint,
+                    params=self._params,
+                    headers=self._headers,
+                    json={
+                        "contents": [{"parts": [{"text": prompt}]}],
+                        "generationConfig": {
+                            "temperature": 0.1,
+                            "maxOutputTokens": 4000,
                         },
-                        headers={"Content-Type": "application/json"},
-                    )
+                    },
+                )
 
-                    response.raise_for_status()
-                    result = response.json()
+                response.raise_for_status()
+                result = response.json()
 
-                    # Extract content from Gemini response format
-                    content = result["candidates"][0]["content"]["parts"][0]["text"]
+                # Extract content from Gemini response format
+                content = result["candidates"][0]["content"]["parts"][0]["text"]
 
-                    extraction_time = time.time() - start_time
-                    self._log_extraction_complete(
-                        page_number, len(content), extraction_time
-                    )
+                extraction_time = time.time() - start_time
+                self._log_extraction_complete(
+                    page_number, len(content), extraction_time
+                )
 
-                    return ExtractedSection(
-                        page_number=page_number,
-                        content=content,
-                        metadata={
-                            "provider": "gemini",
-                            "model": self.model,
-                            "extraction_time": extraction_time,
-                            "input_length": len(page_text),
-                            "output_length": len(content),
-                        },
-                    )
+                return ExtractedSection(
+                    page_number=page_number,
+                    content=content,
+                    metadata={
+                        "provider": "gemini",
+                        "model": self.model,
+                        "extraction_time": extraction_time,
+                        "input_length": len(page_text),
+                        "output_length": len(content),
+                    },
+                )
 
-                except Exception as e:
-                    logger.error(
-                        f"Gemini extraction failed for page {page_number}",
-                        extra={"page_number": page_number, "error": str(e)},
-                    )
-                    raise APIClientError(
-                        f"Gemini extraction failed for page {page_number}: {str(e)}"
-                    )
+            except Exception as e:
+                logger.error(
+                    f"Gemini extraction failed for page {page_number}",
+                    extra={"page_number": page_number, "error": str(e)},
+                )
+                raise APIClientError(
+                    f"Gemini extraction failed for page {page_number}: {str(e)}"
+                )
 
     async def process_document(
         self, pdf_path: str, query: str, chunk_size: int = 50
@@ -166,47 +200,63 @@ class GeminiClient(BaseDocumentClient):
         Args:
             pdf_path: Path to PDF file
             query: User query describing what to extract
-            chunk_size: Pages to process per chunk
+            chunk_size: Maximum number of page requests in flight at once.
+                       Pages are no longer sent in sequential chunks: a new
+                       page starts as soon as any earlier one finishes.
 
         Returns:
-            List[ExtractedSection]: Extracted sections, one per page
-        """
-        import pdfplumber
+            List[ExtractedSection]: Extracted sections, one per page, in order
 
+        Raises:
+            FileProcessingError: If the PDF can't be read or any page fails;
+                                the remaining page requests are cancelled
+        """
         logger.info(
             f"Processing document with Gemini",
             extra={"pdf_path": pdf_path, "model": self.model},
         )
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                logger.info(f"Document has {total_pages} pages")
-
-                sections = []
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    # Extract text
-                    page_text = page.extract_text() or ""
-
-                    # Process page
-                    section = await self.extract_page_content(
+            # Parsing pages is CPU-bound, so the whole read (open, extract,
+            # close) runs in one worker thread, off the event loop
+            page_texts = await asyncio.to_thread(_read_page_texts, pdf_path)
+            total_pages = len(page_texts)
+            logger.info(f"Document has {total_pages} pages")
+
+            # Process pages concurrently, at most chunk_size in flight
+            semaphore = asyncio.Semaphore(chunk_size)
+
+            async def process_page(page_num: int, page_text: str) -> ExtractedSection:
+                async with semaphore:
+                    return await self.extract_page_content(
                         page_data={"text": page_text, "number": page_num},
                         query=query,
                         page_number=page_num,
                     )
 
-                    sections.append(section)
-
-                logger.info(
-                    f"Document processing complete",
-                    extra={
-                        "total_pages": total_pages,
-                        "provider": "gemini",
-                        "model": self.model,
-                    },
-                )
-
-                return sections
+            tasks = [
+                asyncio.ensure_future(process_page(page_num, page_text))
+                for page_num, page_text in enumerate(page_texts, start=1)
+            ]
+            try:
+                sections = await asyncio.gather(*tasks)
+            except BaseException:
+                # gather leaves the other pages running when one fails
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            logger.info(
+                f"Document processing complete",
+                extra={
+                    "total_pages": total_pages,
+                    "provider": "gemini",
+                    "model": self.model,
+                },
+            )
+
+            return sections
 
         except FileNotFoundError:
             raise FileProcessingError(f"PDF file not found: {pdf_path}")
@@ -224,33 +274,34 @@ class GeminiClient(BaseDocumentClient):
         start_time = time.time()
 
         try:
-            async with HTTPClient(timeout=10) as http_client:
-                # Simple test request
-                response = await http_client.post(
-                    url=f"{self.api_base}/models/{self.model}:generateContent?key={self.api_key}",
-                    json={
-                        "contents": [{"parts": [{"text": "test"}]}],
-                        "generationConfig": {"maxOutputTokens": 10},
-                    },
-                    headers={"Content-Type": "application/json"},
-                )
-
-                latency = (time.time() - start_time) * 1000  # ms
-
-                if response.status_code == 200:
-                    return {
-                        "status": "healthy",
-                        "provider": "gemini",
-                        "model": self.model,
-                        "latency_ms": round(latency, 2),
-                    }
-                else:
-                    return {
-                        "status": "unhealthy",
-                        "provider": "gemini",
-                        "error": f"HTTP {response.status_code}",
-                        "latency_ms": round(latency, 2),
-                    }
+            # Simple test request
+            response = await self._http.post(
+                self._endpoint,
+                params=self._params,
+                headers=self._headers,
+                json={
+                    "contents": [{"parts": [{"text": "test"}]}],
+                    "generationConfig": {"maxOutputTokens": 10},
+                },
+                timeout=10,
+            )
+
+            latency = (time.time() - start_time) * 1000  # ms
+
+            if response.status_code == 200:
+                return {
+                    "status": "healthy",
+                    "provider": "gemini",
+                    "model": self.model,
+                    "latency_ms": round(latency, 2),
+                }
+            else:
+                return {
+                    "status": "unhealthy",
+                    "provider": "gemini",
+                    "error": f"HTTP {response.status_code}",
+                    "latency_ms": round(latency, 2),
+                }
 
         except Exception as e:
             latency = (time.time() - start_time) * 1000
@@ -261,6 +312,17 @@ class GeminiClient(BaseDocumentClient):
                 "latency_ms": round(latency, 2),
             }
 
+    async def aclose(self):
+        """
+        Close the pooled HTTP client and release its connections.
+
+        A client passed in by the caller is left open; its owner closes it.
+        The context manager does not call this, since the factory shares one
+        instance across requests; the factory closes it on cleanup.
+        """
+        if self._owns_http:
+            await self._http.aclose()
+
     def _build_prompt(self, query: str, page_text: str, page_number: int) -> str:
         """
         Build extraction prompt for Gemini.
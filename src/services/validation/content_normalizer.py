@@ -6,6 +6,7 @@ Normalizes text to remove formatting differences and extracts comparable feature
 """
 
 import re
+from collections import Counter
 from typing import List, Dict, Set
 import logging
 
@@ -22,6 +23,29 @@ class ContentNormalizer:
     - Clean and prepare text for similarity analysis
     """
 
+    # Optional negative sign, digits with optional comma thousands separators,
+    # optional decimal part. A trailing "%" is left out of the match.
+    _NUMBER_RE = re.compile(r"-?\d+(?:,\d{3})*(?:\.\d+)?")
+
+    # A run of page-break markers and non-alphanumeric characters; markers are
+    # tried first so a run can't stop partway into one and leave "PAGE BREAK"
+    _COMPARISON_SEPARATOR_RE = re.compile(
+        r"(?:---PAGE[- ]BREAK---|\[PAGE BREAK\]|[^a-zA-Z0-9])+"
+    )
+    _NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+    # Whole words made only of lowercase letters and digits
+    _KEY_TERM_RE = re.compile(r"\b[a-z0-9]+\b")
+
+    # ASCII table for key-term tokenizing: uppercase maps to lowercase and
+    # anything that isn't a word character becomes a space
+    _KEY_TERM_TABLE = str.maketrans(
+        {
+            c: c.lower() if c.isalnum() or c == "_" else " "
+            for c in map(chr, range(128))
+        }
+    )
+
     @staticmethod
     def normalize_text(text: str, preserve_case: bool = False) -> str:
         """Normalize text for comparison.
@@ -48,19 +72,14 @@ class ContentNormalizer:
         if not text:
             return ""
 
+        # Collapse whitespace runs, line breaks included, into single spaces
+        # and trim the ends in one split/join
+        text = " ".join(text.split())
+
         # Convert to lowercase unless preserving case
         if not preserve_case:
             text = text.lower()
 
-        # Normalize line breaks to spaces
-        text = text.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
-
-        # Collapse multiple whitespace into single space
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove leading/trailing whitespace
-        text = text.strip()
-
         return text
 
     @staticmethod
@@ -89,28 +108,11 @@ class ContentNormalizer:
         if not text:
             return []
 
-        numbers = []
-
-        # Pattern matches:
-        # - Optional negative sign
-        # - Digits with optional comma separators
-        # - Optional decimal point and decimal digits
-        # - Optional percentage sign
-        pattern = r"-?\d+(?:,\d{3})*(?:\.\d+)?%?"
-
-        matches = re.findall(pattern, text)
-
-        for match in matches:
-            try:
-                # Remove commas and percentage sign
-                clean_num = match.replace(",", "").rstrip("%")
-                numbers.append(float(clean_num))
-            except ValueError:
-                # Skip invalid numbers
-                logger.debug(f"Could not parse number: {match}")
-                continue
-
-        return numbers
+        # Every match is a valid float literal once the commas are removed
+        return [
+            float(match.replace(",", ""))
+            for match in ContentNormalizer._NUMBER_RE.findall(text)
+        ]
 
     @staticmethod
     def extract_key_terms(text: str, min_length: int = 3) -> Set[str]:
@@ -130,14 +132,7 @@ class ContentNormalizer:
         if not text:
             return set()
 
-        # Normalize text
-        text = ContentNormalizer.normalize_text(text)
-
-        # Extract words (alphanumeric sequences)
-        words = re.findall(r"\b[a-z0-9]+\b", text)
-
-        # Filter by minimum length and convert to set
-        return {word for word in words if len(word) >= min_length}
+        return set(ContentNormalizer._key_term_words(text, min_length))
 
     @staticmethod
     def calculate_word_frequency(text: str) -> Dict[str, int]:
@@ -156,21 +151,36 @@ class ContentNormalizer:
         if not text:
             return {}
 
-        # Extract key terms
-        terms = ContentNormalizer.extract_key_terms(text)
+        # Count the key-term words in one pass over the tokens
+        return dict(Counter(ContentNormalizer._key_term_words(text)))
 
-        # Normalize text for counting
-        normalized = ContentNormalizer.normalize_text(text)
+    @staticmethod
+    def _key_term_words(text: str, min_length: int = 3) -> List[str]:
+        """Split text into its key-term words, keeping repeats.
 
-        # Count occurrences
-        frequency = {}
-        for term in terms:
-            # Use word boundaries to avoid partial matches
-            pattern = rf"\b{re.escape(term)}\b"
-            count = len(re.findall(pattern, normalized))
-            frequency[term] = count
+        Args:
+            text: Input text
+            min_length: Minimum word length to include
+
+        Returns:
+            Lowercase alphanumeric words in order of appearance
+        """
+        if text.isascii():
+            # Lowercase and split on non-word characters in one C pass. "_" is
+            # a word character, so words containing it never matched before
+            words = text.translate(ContentNormalizer._KEY_TERM_TABLE).split()
+            return [
+                word for word in words if len(word) >= min_length and "_" not in word
+            ]
 
-        return frequency
+        # Normalize text
+        text = ContentNormalizer.normalize_text(text)
+
+        # Extract words (alphanumeric sequences)
+        words = ContentNormalizer._KEY_TERM_RE.findall(text)
+
+        # Filter by minimum length
+        return [word for word in words if len(word) >= min_length]
 
     @staticmethod
     def remove_page_breaks(text: str) -> str:
@@ -185,15 +195,15 @@ class ContentNormalizer:
         if not text:
             return ""
 
-        # Remove common page break markers
+        # Remove common page break markers. Literal replace uses CPython's fast
+        # substring search and beats a single alternation regex over the text
         text = text.replace("---PAGE-BREAK---", " ")
         text = text.replace("---PAGE BREAK---", " ")
         text = text.replace("[PAGE BREAK]", " ")
 
-        # Collapse whitespace
-        text = re.sub(r"\s+", " ", text)
-
-        return text.strip()
+        # Collapse whitespace and trim; split() treats the same characters as
+        # whitespace as "\s" does
+        return " ".join(text.split())
 
     @staticmethod
     def normalize_for_comparison(text: str) -> str:
@@ -214,16 +224,13 @@ class ContentNormalizer:
         if not text:
             return ""
 
-        # Remove page breaks
-        text = ContentNormalizer.remove_page_breaks(text)
-
-        # Normalize case and whitespace
-        text = ContentNormalizer.normalize_text(text)
-
-        # Remove punctuation (keep alphanumeric and spaces)
-        text = re.sub(r"[^a-z0-9\s]", " ", text)
-
-        # Final whitespace collapse
-        text = re.sub(r"\s+", " ", text)
+        if text.isascii():
+            # Page breaks, punctuation and whitespace all collapse to a single
+            # space in one pass; lowercasing after is safe for ASCII
+            separator_re = ContentNormalizer._COMPARISON_SEPARATOR_RE
+            return separator_re.sub(" ", text).strip().lower()
 
-        return text.strip()
+        # Lowercasing can turn non-ASCII letters into ASCII ones (the Kelvin
+        # sign becomes "k"), so lowercase before stripping non-alphanumerics
+        text = ContentNormalizer.remove_page_breaks(text).lower()
+        return ContentNormalizer._NON_ALNUM_RE.sub(" ", text).strip()
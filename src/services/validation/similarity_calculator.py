@@ -5,15 +5,48 @@ This module provides methods to calculate similarity between two text extraction
 Supports multiple similarity methods optimized for different content types.
 """
 
+import hashlib
+import math
 import re
-from typing import List, Dict, Tuple
-from collections import Counter
+from typing import AbstractSet, List, Dict, Tuple
+from collections import Counter, OrderedDict
 import logging
 
 from src.services.validation.content_normalizer import ContentNormalizer
 
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:  # pragma: no cover - rapidfuzz ships with python-Levenshtein
+    _Levenshtein = None
+
 logger = logging.getLogger(__name__)
 
+# Levenshtein inputs are truncated to this length. rapidfuzz's bit-parallel
+# native implementation takes ~80ms at 50k characters; the pure-Python DP is
+# limited to the old bound.
+LEVENSHTEIN_MAX_LENGTH = 50_000 if _Levenshtein is not None else 10_000
+
+# Texts this long skip Levenshtein in the similarity report, which validation
+# computes on the event loop
+LEVENSHTEIN_REPORT_MAX_LENGTH = 5_000
+
+# Similarity reports are cached by text digest, for up to this many text pairs;
+# pairs where either text is shorter than the minimum are cheaper to recompute
+REPORT_CACHE_SIZE = 1024
+REPORT_CACHE_MIN_LENGTH = 256
+
+# Digest pair -> similarity report, least recently used first. Module-level
+# because handlers build a new calculator per validation; reports depend only
+# on the two texts, so every instance can share them.
+_report_cache: OrderedDict = OrderedDict()
+
+
+def _text_digest(text: str) -> bytes:
+    """Hash a text into a compact cache key that doesn't keep the text alive."""
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
 
 class SimilarityCalculator:
     """Calculate similarity scores between two text documents.
@@ -79,30 +112,40 @@ class SimilarityCalculator:
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        # Extract numbers from both texts
-        numbers1 = self.normalizer.extract_numbers(text1)
-        numbers2 = self.normalizer.extract_numbers(text2)
+        # Extract numbers and their frequency distributions from both texts
+        freq1 = Counter(self.normalizer.extract_numbers(text1))
+        freq2 = Counter(self.normalizer.extract_numbers(text2))
+
+        return self._number_frequency_from_counters(freq1, freq2)
+
+    def _number_frequency_from_counters(self, freq1: Counter, freq2: Counter) -> float:
+        """Calculate number frequency similarity from precomputed counters.
 
+        Args:
+            freq1: Number frequency distribution of the first text
+            freq2: Number frequency distribution of the second text
+
+        Returns:
+            Similarity score between 0.0 and 1.0
+        """
         # Handle edge cases
-        if not numbers1 and not numbers2:
+        if not freq1 and not freq2:
             logger.debug("Both texts have no numbers, returning 1.0")
             return 1.0  # Both empty
 
-        if not numbers1 or not numbers2:
+        if not freq1 or not freq2:
             logger.debug("One text has no numbers, returning 0.0")
             return 0.0  # One empty
 
-        # Calculate frequency distributions
-        freq1 = Counter(numbers1)
-        freq2 = Counter(numbers2)
-
         # Calculate cosine similarity
         similarity = self._cosine_similarity_from_counters(freq1, freq2)
 
-        logger.debug(
-            f"Number frequency similarity: {similarity:.3f} "
-            f"({len(numbers1)} vs {len(numbers2)} numbers)"
-        )
+        # Totalling the counters is a pass over each, so only do it when logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Number frequency similarity: {similarity:.3f} "
+                f"({sum(freq1.values())} vs {sum(freq2.values())} numbers)"
+            )
 
         return similarity
 
@@ -122,6 +165,20 @@ class SimilarityCalculator:
         terms1 = self.normalizer.extract_key_terms(text1)
         terms2 = self.normalizer.extract_key_terms(text2)
 
+        return self._word_overlap_from_terms(terms1, terms2)
+
+    def _word_overlap_from_terms(
+        self, terms1: AbstractSet[str], terms2: AbstractSet[str]
+    ) -> float:
+        """Calculate word overlap similarity from precomputed term sets.
+
+        Args:
+            terms1: Unique key terms of the first text
+            terms2: Unique key terms of the second text
+
+        Returns:
+            Similarity score between 0.0 and 1.0 (Jaccard index)
+        """
         # Handle edge cases
         if not terms1 and not terms2:
             return 1.0  # Both empty
@@ -159,6 +216,20 @@ class SimilarityCalculator:
         freq1 = self.normalizer.calculate_word_frequency(text1)
         freq2 = self.normalizer.calculate_word_frequency(text2)
 
+        return self._cosine_from_frequencies(freq1, freq2)
+
+    def _cosine_from_frequencies(
+        self, freq1: Dict[str, int], freq2: Dict[str, int]
+    ) -> float:
+        """Calculate word cosine similarity from precomputed frequencies.
+
+        Args:
+            freq1: Word frequencies of the first text
+            freq2: Word frequencies of the second text
+
+        Returns:
+            Similarity score between 0.0 and 1.0
+        """
         # Handle edge cases
         if not freq1 and not freq2:
             return 1.0
@@ -194,14 +265,13 @@ class SimilarityCalculator:
         text2 = self.normalizer.normalize_for_comparison(text2)
 
         # Truncate very long texts (performance optimization)
-        MAX_LENGTH = 10000
-        if len(text1) > MAX_LENGTH:
-            text1 = text1[:MAX_LENGTH]
-            logger.warning(f"Text1 truncated to {MAX_LENGTH} characters")
+        if len(text1) > LEVENSHTEIN_MAX_LENGTH:
+            text1 = text1[:LEVENSHTEIN_MAX_LENGTH]
+            logger.warning(f"Text1 truncated to {LEVENSHTEIN_MAX_LENGTH} characters")
 
-        if len(text2) > MAX_LENGTH:
-            text2 = text2[:MAX_LENGTH]
-            logger.warning(f"Text2 truncated to {MAX_LENGTH} characters")
+        if len(text2) > LEVENSHTEIN_MAX_LENGTH:
+            text2 = text2[:LEVENSHTEIN_MAX_LENGTH]
+            logger.warning(f"Text2 truncated to {LEVENSHTEIN_MAX_LENGTH} characters")
 
         # Handle edge cases
         if text1 == text2:
@@ -229,6 +299,8 @@ class SimilarityCalculator:
     ) -> float:
         """Calculate cosine similarity from two Counter objects.
 
+        Plain ``{key: count}`` dictionaries are accepted as well.
+
         Args:
             counter1: First frequency counter
             counter2: Second frequency counter
@@ -236,26 +308,26 @@ class SimilarityCalculator:
         Returns:
             Cosine similarity score
         """
-        # Get all unique keys
-        all_keys = set(counter1.keys()) | set(counter2.keys())
+        # Only shared keys contribute to the dot product, so walk the smaller
+        # counter and look its keys up in the larger one
+        if len(counter1) > len(counter2):
+            counter1, counter2 = counter2, counter1
 
-        if not all_keys:
-            return 0.0
+        get = counter2.get
+        dot_product = sum([count * get(key, 0) for key, count in counter1.items()])
 
-        # Build vectors
-        vec1 = [counter1.get(key, 0) for key in all_keys]
-        vec2 = [counter2.get(key, 0) for key in all_keys]
+        # Disjoint (or empty) counters are orthogonal; skip the magnitudes
+        if not dot_product:
+            return 0.0
 
-        # Calculate dot product and magnitudes
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
+        # Vector magnitudes, computed in C by math.hypot
+        magnitude = math.hypot(*counter1.values()) * math.hypot(*counter2.values())
 
         # Calculate cosine similarity
-        if magnitude1 * magnitude2 == 0:
+        if magnitude == 0:
             return 0.0
 
-        return dot_product / (magnitude1 * magnitude2)
+        return dot_product / magnitude
 
     def _cosine_similarity_from_dicts(
         self, dict1: Dict[str, int], dict2: Dict[str, int]
@@ -269,13 +341,31 @@ class SimilarityCalculator:
         Returns:
             Cosine similarity score
         """
-        counter1 = Counter(dict1)
-        counter2 = Counter(dict2)
-        return self._cosine_similarity_from_counters(counter1, counter2)
+        # The counter version only reads keys and counts, so plain dicts can be
+        # passed straight through instead of being copied into Counters
+        return self._cosine_similarity_from_counters(dict1, dict2)
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein distance between two strings.
 
+        Uses rapidfuzz's native implementation when it is installed, and the
+        pure-Python dynamic programming version otherwise.
+
+        Args:
+            s1: First string
+            s2: Second string
+
+        Returns:
+            Edit distance
+        """
+        if _Levenshtein is not None:
+            return _Levenshtein.distance(s1, s2)
+
+        return self._levenshtein_distance_dp(s1, s2)
+
+    def _levenshtein_distance_dp(self, s1: str, s2: str) -> int:
+        """Calculate Levenshtein distance in pure Python.
+
         Uses dynamic programming with space optimization.
 
         Args:
@@ -286,29 +376,65 @@ class SimilarityCalculator:
             Edit distance
         """
         if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+            s1, s2 = s2, s1
+
+        # A shared prefix or suffix never changes the distance, and two
+        # extractions of the same page usually share long runs of text
+        start, end1, end2 = 0, len(s1), len(s2)
+        while start < end2 and s1[start] == s2[start]:
+            start += 1
+        while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+            end1 -= 1
+            end2 -= 1
+        s1, s2 = s1[start:end1], s2[start:end2]
 
         if len(s2) == 0:
             return len(s1)
 
         # Use only two rows instead of full matrix (space optimization)
-        previous_row = range(len(s2) + 1)
-
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                # Cost of insertion, deletion, or substitution
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
+        previous_row = list(range(len(s2) + 1))
+
+        for i, c1 in enumerate(s1, 1):
+            current_row = [i]
+            append = current_row.append
+            left = i
+            for c2, diagonal, above in zip(s2, previous_row, previous_row[1:]):
+                if c1 == c2:
+                    # Neighbouring cells differ by at most one, so a match
+                    # always takes the diagonal
+                    left = diagonal
+                else:
+                    # Cheapest of insertion, deletion or substitution, without
+                    # the overhead of calling min()
+                    if above < left:
+                        left = above
+                    if diagonal < left:
+                        left = diagonal
+                    left += 1
+                append(left)
             previous_row = current_row
 
         return previous_row[-1]
 
+    def _text_features(self, text: str) -> Tuple[Counter, Dict[str, int]]:
+        """Derive the features the similarity report compares.
+
+        Args:
+            text: Text document
+
+        Returns:
+            Tuple of (number frequency counter, word frequency dictionary)
+        """
+        numbers = Counter(self.normalizer.extract_numbers(text))
+        words = self.normalizer.calculate_word_frequency(text)
+        return numbers, words
+
     def calculate_similarity_report(self, text1: str, text2: str) -> Dict[str, float]:
         """Calculate similarity using all methods and return a report.
 
+        Reports for longer texts are cached by the texts' digests, so comparing
+        the same pair again (retries, re-validation) is a lookup.
+
         Args:
             text1: First text document
             text2: Second text document
@@ -316,14 +442,49 @@ class SimilarityCalculator:
         Returns:
             Dictionary with similarity scores for all methods
         """
+        if min(len(text1), len(text2)) < REPORT_CACHE_MIN_LENGTH:
+            return self._similarity_report(text1, text2)
+
+        # Every method is symmetric, so both orders of a pair share one entry
+        key = tuple(sorted((_text_digest(text1), _text_digest(text2))))
+        report = _report_cache.get(key)
+        if report is None:
+            report = _report_cache[key] = self._similarity_report(text1, text2)
+            if len(_report_cache) > REPORT_CACHE_SIZE:
+                _report_cache.popitem(last=False)
+        else:
+            _report_cache.move_to_end(key)
+            logger.debug("Similarity report served from cache")
+
+        # Callers get their own copy so they can't alter the cached report
+        return dict(report)
+
+    def _similarity_report(self, text1: str, text2: str) -> Dict[str, float]:
+        """Compute the similarity report for two texts without caching.
+
+        Args:
+            text1: First text document
+            text2: Second text document
+
+        Returns:
+            Dictionary with similarity scores for all methods
+        """
+        # Derive each text's features once and share them across methods
+        numbers1, words1 = self._text_features(text1)
+        numbers2, words2 = self._text_features(text2)
+
         report = {
-            "number_frequency": self._number_frequency_similarity(text1, text2),
-            "word_overlap": self._word_overlap_similarity(text1, text2),
-            "cosine": self._cosine_similarity(text1, text2),
+            "number_frequency": self._number_frequency_from_counters(
+                numbers1, numbers2
+            ),
+            # Word frequency keys are exactly the text's key terms
+            "word_overlap": self._word_overlap_from_terms(words1.keys(), words2.keys()),
+            "cosine": self._cosine_from_frequencies(words1, words2),
         }
 
         # Only calculate Levenshtein for short texts (expensive)
-        if len(text1) < 5000 and len(text2) < 5000:
+        max_length = LEVENSHTEIN_REPORT_MAX_LENGTH
+        if len(text1) < max_length and len(text2) < max_length:
             report["levenshtein"] = self._levenshtein_similarity(text1, text2)
         else:
             report["levenshtein"] = None  # Skipped for performance
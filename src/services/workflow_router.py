@@ -6,12 +6,150 @@ based on query keywords and document characteristics.
 """
 
 import logging
-from typing import Optional
+import re
+from typing import Dict, Iterable, Optional, Tuple
 
 from src.workflows.workflow_types import WorkflowType
 
 logger = logging.getLogger(__name__)
 
+# Routing keywords per workflow, in priority order (most specific first).
+# MISTRAL has no keywords; it is the fallback when nothing matches.
+_ROUTING_KEYWORDS: Dict[WorkflowType, Tuple[str, ...]] = {
+    # Priority 1: TEXT_EXTRACTION (no AI)
+    WorkflowType.TEXT_EXTRACTION: (
+        "text extraction",
+        "text only",
+        "pdfplumber",
+        "pymupdf",
+        "no ai",
+        "raw text",
+        "simple extraction",
+        "plain text",
+    ),
+    # Priority 2: AZURE_DOCUMENT_INTELLIGENCE (tables/forms)
+    WorkflowType.AZURE_DOCUMENT_INTELLIGENCE: (
+        "azure di",
+        "azure document intelligence",
+        "document intelligence",
+        "smart tables",
+        "table extraction",
+        "form",
+        "invoice",
+        "structured document",
+        "layout",
+    ),
+    # Priority 3: OCR_WITH_IMAGES (scanned docs/images)
+    WorkflowType.OCR_WITH_IMAGES: (
+        "ocr",
+        "images",
+        "charts",
+        "diagrams",
+        "scanned",
+        "scan",
+        "handwritten",
+        "visual content",
+        "image extraction",
+    ),
+    # Priority 4: GEMINI (high quality)
+    WorkflowType.GEMINI: (
+        "gemini",
+        "google",
+        "high quality",
+        "best quality",
+        "maximum quality",
+    ),
+}
+
+
+def _build_trie(words: Iterable[str]) -> Dict[str, dict]:
+    """Build a character trie of keywords, one nested dict per character.
+
+    A node holding the ``""`` key ends a keyword. Keywords that extend a
+    shorter keyword (``"scanned"`` after ``"scan"``) are dropped: wherever the
+    longer one occurs, the shorter one does too.
+
+    Args:
+        words: Keywords to insert
+
+    Returns:
+        Root node of the trie
+    """
+    trie: Dict[str, dict] = {}
+    for word in sorted(words, key=len):
+        node = trie
+        for char in word:
+            if "" in node:
+                break
+            node = node.setdefault(char, {})
+        else:
+            node[""] = {}
+    return trie
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Render a keyword trie as a prefix-factored regex alternation.
+
+    Shared prefixes become a single edge (``"text (?:extraction|only)"``), so
+    the regex engine tests each prefix once per position instead of once per
+    keyword.
+
+    Args:
+        node: Trie node to render
+
+    Returns:
+        Regex source matching any keyword below ``node``
+    """
+    if "" in node:
+        return ""
+
+    branches = [
+        re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items())
+    ]
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+def _compile_routes(
+    keywords: Dict[WorkflowType, Tuple[str, ...]]
+) -> Tuple[Tuple[WorkflowType, re.Pattern], ...]:
+    """Compile each workflow's keywords into one trie-factored pattern.
+
+    Patterns are returned in priority order. A single alternation over every
+    keyword can't be used directly: ``search`` returns the leftmost keyword in
+    the query, not the highest-priority one.
+
+    Args:
+        keywords: Workflow to keyword mapping, in priority order
+
+    Returns:
+        (workflow type, compiled pattern) pairs in priority order
+    """
+    return tuple(
+        (workflow_type, re.compile(_trie_pattern(_build_trie(words))))
+        for workflow_type, words in keywords.items()
+    )
+
+
+_ROUTES = _compile_routes(_ROUTING_KEYWORDS)
+
+
+def _match_workflow(query: Optional[str]) -> Optional[WorkflowType]:
+    """Find the highest-priority workflow whose keywords occur in the query.
+
+    Args:
+        query: User query string
+
+    Returns:
+        Matched workflow type, or None if no keyword matches
+    """
+    query_lower = query.lower() if query else ""
+
+    for workflow_type, pattern in _ROUTES:
+        if pattern.search(query_lower):
+            return workflow_type
+
+    return None
+
 
 def get_workflow_type(
     query: str, explicit_workflow: Optional[str] = None
@@ -62,66 +200,11 @@ def get_workflow_type(
                 f"Valid options: {[wf.value for wf in WorkflowType]}"
             )
 
-    # Analyze query for keywords
-    query_lower = query.lower() if query else ""
-
-    # Priority 1: TEXT_EXTRACTION (no AI)
-    text_extraction_keywords = [
-        "text extraction",
-        "text only",
-        "pdfplumber",
-        "no ai",
-        "raw text",
-        "simple extraction",
-        "plain text",
-    ]
-    if any(keyword in query_lower for keyword in text_extraction_keywords):
-        logger.info("Routing to TEXT_EXTRACTION workflow (keyword match)")
-        return WorkflowType.TEXT_EXTRACTION
-
-    # Priority 2: AZURE_DOCUMENT_INTELLIGENCE (tables/forms)
-    azure_di_keywords = [
-        "azure di",
-        "azure document intelligence",
-        "document intelligence",
-        "smart tables",
-        "table extraction",
-        "form",
-        "invoice",
-        "structured document",
-        "layout",
-    ]
-    if any(keyword in query_lower for keyword in azure_di_keywords):
-        logger.info("Routing to AZURE_DOCUMENT_INTELLIGENCE workflow (keyword match)")
-        return WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
-
-    # Priority 3: OCR_WITH_IMAGES (scanned docs/images)
-    ocr_keywords = [
-        "ocr",
-        "images",
-        "charts",
-        "diagrams",
-        "scanned",
-        "scan",
-        "handwritten",
-        "visual content",
-        "image extraction",
-    ]
-    if any(keyword in query_lower for keyword in ocr_keywords):
-        logger.info("Routing to OCR_WITH_IMAGES workflow (keyword match)")
-        return WorkflowType.OCR_WITH_IMAGES
-
-    # Priority 4: GEMINI (high quality)
-    gemini_keywords = [
-        "gemini",
-        "google",
-        "high quality",
-        "best quality",
-        "maximum quality",
-    ]
-    if any(keyword in query_lower for keyword in gemini_keywords):
-        logger.info("Routing to GEMINI workflow (keyword match)")
-        return WorkflowType.GEMINI
+    # Analyze query for keywords, one compiled pattern per workflow
+    workflow_type = _match_workflow(query)
+    if workflow_type is not None:
+        logger.info(f"Routing to {workflow_type.name} workflow (keyword match)")
+        return workflow_type
 
     # Priority 5: MISTRAL (default)
     logger.info("Routing to MISTRAL workflow (default)")
@@ -3,27 +3,199 @@ Text Extraction Handler.
 
 This handler provides fast PDF text extraction using pdfplumber without AI processing.
 Best for: Simple text extraction where AI enhancement is not needed.
+
+PyMuPDF can be used instead by setting TEXT_EXTRACTION_BACKEND=pymupdf. It is
+not installed by default because it is AGPL-3.0 licensed (see README).
 """
 
+import os
 import time
+import asyncio
 import logging
-from typing import Optional, List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Iterable, Iterator, Optional, List, Tuple
 import pdfplumber
 
+try:
+    import pymupdf
+except ImportError:  # optional (AGPL-3.0): extraction falls back to pdfplumber
+    pymupdf = None
+
 from src.services.workflows.base_handler import BaseWorkflowHandler
 from src.workflows.workflow_types import WorkflowType
 from src.models.workflow_models import WorkflowResult, ExtractedSection
-from src.core.error_handling import ExtractionError
+from src.core.config import settings
+from src.core.error_handling import ConfigurationError, ExtractionError
 from src.core.constants import CONTENT_SEPARATOR
 
 logger = logging.getLogger(__name__)
 
+# Libraries the handler can read PDFs with
+TEXT_EXTRACTION_BACKENDS = ("pdfplumber", "pymupdf")
+
+# Errors meaning the PDF file doesn't exist, for the installed libraries
+_NOT_FOUND_ERRORS: Tuple[type, ...] = (FileNotFoundError,)
+if pymupdf is not None:
+    _NOT_FOUND_ERRORS += (pymupdf.FileNotFoundError,)
+
+# Worker processes used to read large documents, and the fewest pages worth
+# handing to one; documents under twice that many pages are read in-process
+MAX_EXTRACTION_WORKERS = min(os.cpu_count() or 1, 4)
+MIN_PAGES_PER_WORKER = 8
+
+# Process pool shared by all requests; created on first use
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+
+# (text, tables, page width, page height) for one page
+_PageData = Tuple[str, List[List[List[str]]], float, float]
+
+
+def _open_pdf(backend: str, pdf_path: str) -> Any:
+    """Open a PDF with the given backend; the result is a context manager.
+
+    Args:
+        backend: One of TEXT_EXTRACTION_BACKENDS
+        pdf_path: Path to PDF file
+
+    Returns:
+        Open pdfplumber or PyMuPDF document
+    """
+    if backend == "pymupdf":
+        return pymupdf.open(pdf_path)
+    return pdfplumber.open(pdf_path)
+
+
+def _page_count(backend: str, pdf: Any) -> int:
+    """Return the number of pages in a document opened by ``_open_pdf``."""
+    if backend == "pymupdf":
+        return pdf.page_count
+    return len(pdf.pages)
+
+
+def _iter_pages(
+    backend: str, pdf: Any, start: int, stop: int, detect_tables: bool = True
+) -> Iterator[_PageData]:
+    """Read text, tables and size for pages ``start`` to ``stop - 1``.
+
+    Pages are read one at a time as the caller consumes them.
+
+    Args:
+        backend: Backend the document was opened with
+        pdf: Document opened by ``_open_pdf``
+        start: First page index (0-based)
+        stop: Page index to stop before
+        detect_tables: Whether to run table detection (the costliest step)
+
+    Yields:
+        Raw page data, in page order
+    """
+    if backend == "pymupdf":
+        for page in pdf.pages(start, stop):
+            yield (
+                page.get_text("text"),
+                (
+                    [table.extract() for table in page.find_tables().tables]
+                    if detect_tables
+                    else []
+                ),
+                page.rect.width,
+                page.rect.height,
+            )
+        return
+
+    for page in pdf.pages[start:stop]:
+        yield (
+            page.extract_text() or "",
+            (page.extract_tables() or []) if detect_tables else [],
+            page.width,
+            page.height,
+        )
+
+
+def _read_page_range(
+    backend: str,
+    pdf_path: str,
+    start: int,
+    stop: int,
+    detect_tables: bool = True,
+) -> List[_PageData]:
+    """Open a PDF and read one page range; runs in a worker process.
+
+    Args:
+        backend: One of TEXT_EXTRACTION_BACKENDS
+        pdf_path: Path to PDF file
+        start: First page index (0-based)
+        stop: Page index to stop before
+        detect_tables: Whether to run table detection
+
+    Returns:
+        Raw page data, in page order
+    """
+    with _open_pdf(backend, pdf_path) as pdf:
+        return list(_iter_pages(backend, pdf, start, stop, detect_tables))
+
+
+def _worker_count(total_pages: int) -> int:
+    """Return how many worker processes should read a document.
+
+    Args:
+        total_pages: Number of pages in the document
+
+    Returns:
+        Number of page ranges to read in parallel; 1 or less means read
+        in-process
+    """
+    return min(MAX_EXTRACTION_WORKERS, total_pages // MIN_PAGES_PER_WORKER)
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use.
+
+    Workers are started with forkserver (or spawn where that isn't
+    available) rather than fork, so they don't inherit the server's event
+    loop, threads or open sockets.
+
+    Returns:
+        Process pool with at most MAX_EXTRACTION_WORKERS workers
+    """
+    global _extraction_pool
+
+    if _extraction_pool is None:
+        method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=MAX_EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context(method),
+        )
+
+    return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the shared worker pool without waiting for it.
+
+    Queued page ranges are cancelled; workers exit once their current range
+    is done. Should be called on application shutdown.
+    """
+    global _extraction_pool
+
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=False, cancel_futures=True)
+        _extraction_pool = None
+        logger.info("Text extraction worker pool shut down")
+
 
 class TextExtractionHandler(BaseWorkflowHandler):
     """Handler for simple text extraction using pdfplumber.
 
     This workflow does not use any AI providers. It simply extracts
-    raw text from the PDF using pdfplumber.
+    raw text from the PDF using pdfplumber, or PyMuPDF when that optional
+    backend is selected and installed.
 
     Advantages:
         - Fast (no API calls)
@@ -38,15 +210,38 @@ class TextExtractionHandler(BaseWorkflowHandler):
         - Limited table extraction
     """
 
-    def __init__(self):
-        """Initialize text extraction handler."""
+    def __init__(self, backend: Optional[str] = None):
+        """Initialize text extraction handler.
+
+        Args:
+            backend: PDF library to use, "pdfplumber" or "pymupdf"
+                    (default: settings.TEXT_EXTRACTION_BACKEND)
+
+        Raises:
+            ConfigurationError: If the backend name is unknown
+        """
         super().__init__(WorkflowType.TEXT_EXTRACTION)
 
+        backend = (backend or settings.TEXT_EXTRACTION_BACKEND).lower()
+        if backend not in TEXT_EXTRACTION_BACKENDS:
+            raise ConfigurationError(
+                f"Unknown text extraction backend: {backend}. "
+                f"Valid options: {list(TEXT_EXTRACTION_BACKENDS)}"
+            )
+        if backend == "pymupdf" and pymupdf is None:
+            logger.warning(
+                "PyMuPDF is not installed; using pdfplumber instead"
+            )
+            backend = "pdfplumber"
+
+        self.backend = backend
+
     async def execute(
         self,
         pdf_path: str,
         query: str,
         enable_validation: Optional[bool] = None,
+        detect_tables: Optional[bool] = None,
     ) -> WorkflowResult:
         """Execute text extraction workflow.
 
@@ -54,6 +249,10 @@ class TextExtractionHandler(BaseWorkflowHandler):
             pdf_path: Path to PDF file
             query: User query (not used in this workflow)
             enable_validation: Not used (no validation for text-only extraction)
+            detect_tables: Whether to detect and append tables
+                          (default: settings.TEXT_EXTRACTION_DETECT_TABLES).
+                          Table cells stay in the page text when False; only
+                          the formatted TABLE blocks are left out.
 
         Returns:
             WorkflowResult with extracted text and metadata
@@ -64,8 +263,11 @@ class TextExtractionHandler(BaseWorkflowHandler):
         start_time = time.time()
         self._log_start(pdf_path, query)
 
+        if detect_tables is None:
+            detect_tables = settings.TEXT_EXTRACTION_DETECT_TABLES
+
         try:
-            sections = await self._extract_text(pdf_path)
+            sections = await self._extract_text(pdf_path, detect_tables)
 
             # Combine all sections
             content = CONTENT_SEPARATOR.join([section.content for section in sections])
@@ -75,8 +277,9 @@ class TextExtractionHandler(BaseWorkflowHandler):
                 "workflow": self.workflow_type.value,
                 "pages": len(sections),
                 "processing_time_seconds": time.time() - start_time,
-                "provider": "pdfplumber",
+                "provider": self.backend,
                 "ai_used": False,
+                "tables_scanned": detect_tables,
             }
 
             execution_time = time.time() - start_time
@@ -93,11 +296,19 @@ class TextExtractionHandler(BaseWorkflowHandler):
             logger.error(f"Text extraction failed: {e}", exc_info=True)
             raise ExtractionError(f"Failed to extract text from PDF: {e}")
 
-    async def _extract_text(self, pdf_path: str) -> List[ExtractedSection]:
-        """Extract text from PDF using pdfplumber.
+    async def _extract_text(
+        self, pdf_path: str, detect_tables: bool = True
+    ) -> List[ExtractedSection]:
+        """Extract text from PDF using the configured backend.
+
+        Small documents are read in a single worker thread, off the event
+        loop. Larger ones are split into contiguous page ranges that worker
+        processes read in parallel, each opening its own copy of the document
+        (open documents can't be shared across threads or processes).
 
         Args:
             pdf_path: Path to PDF file
+            detect_tables: Whether to detect and append tables
 
         Returns:
             List of ExtractedSection objects, one per page
@@ -105,50 +316,160 @@ class TextExtractionHandler(BaseWorkflowHandler):
         Raises:
             ExtractionError: If PDF cannot be read
         """
-        sections = []
-
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                logger.info(f"Extracting text from {total_pages} pages")
-
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    # Extract text
-                    text = page.extract_text() or ""
-
-                    # Try to extract tables if present
-                    tables = page.extract_tables()
-                    if tables:
-                        table_text = self._format_tables(tables)
-                        if table_text:
-                            text += f"\n\n{table_text}"
-
-                    # Create section
-                    section = ExtractedSection(
-                        page_number=page_num,
-                        content=text,
-                        metadata={
-                            "char_count": len(text),
-                            "has_tables": len(tables) > 0 if tables else False,
-                            "page_width": page.width,
-                            "page_height": page.height,
-                        },
-                    )
-                    sections.append(section)
-
-                    logger.debug(
-                        f"Extracted page {page_num}/{total_pages} | "
-                        f"{len(text)} chars | "
-                        f"{len(tables) if tables else 0} tables"
-                    )
-
-        except FileNotFoundError:
+            # Opening, reading and closing all happen in one worker thread, so
+            # a cancelled request can't close the document mid-read
+            total_pages, sections = await asyncio.to_thread(
+                self._read_document, pdf_path, detect_tables
+            )
+
+            if sections is None:
+                pages = await self._read_pages_parallel(
+                    pdf_path,
+                    total_pages,
+                    _worker_count(total_pages),
+                    detect_tables,
+                )
+                sections = self._build_sections(pages, total_pages)
+
+        except _NOT_FOUND_ERRORS:
             raise ExtractionError(f"PDF file not found: {pdf_path}")
         except Exception as e:
             raise ExtractionError(f"Failed to read PDF: {e}")
 
         return sections
 
+    def _read_document(
+        self, pdf_path: str, detect_tables: bool
+    ) -> Tuple[int, Optional[List[ExtractedSection]]]:
+        """Open a PDF, read it if it is small enough, and close it.
+
+        Runs in a worker thread. Each page is formatted as soon as it is read,
+        so pages never pile up in memory ahead of the formatter.
+
+        Args:
+            pdf_path: Path to PDF file
+            detect_tables: Whether to detect and append tables
+
+        Returns:
+            Page count, and the sections; sections are None when the document
+            is large enough to be read by worker processes instead
+        """
+        with _open_pdf(self.backend, pdf_path) as pdf:
+            total_pages = _page_count(self.backend, pdf)
+            logger.info(f"Extracting text from {total_pages} pages")
+
+            if _worker_count(total_pages) > 1:
+                return total_pages, None
+
+            return total_pages, self._build_sections(
+                _iter_pages(self.backend, pdf, 0, total_pages, detect_tables),
+                total_pages,
+            )
+
+    def _build_sections(
+        self, pages: Iterable[_PageData], total_pages: int
+    ) -> List[ExtractedSection]:
+        """Turn raw page data into sections, appending formatted tables.
+
+        Args:
+            pages: Raw page data, in page order
+            total_pages: Number of pages in the document (for logging)
+
+        Returns:
+            List of ExtractedSection objects, one per page
+        """
+        sections = []
+
+        for page_num, (text, tables, width, height) in enumerate(
+            pages, start=1
+        ):
+            # Append tables if present
+            if tables:
+                table_text = self._format_tables(tables)
+                if table_text:
+                    text += f"\n\n{table_text}"
+
+            # Create section
+            section = ExtractedSection(
+                page_number=page_num,
+                content=text,
+                metadata={
+                    "char_count": len(text),
+                    "has_tables": len(tables) > 0,
+                    "page_width": width,
+                    "page_height": height,
+                },
+            )
+            sections.append(section)
+
+            logger.debug(
+                f"Extracted page {page_num}/{total_pages} | "
+                f"{len(text)} chars | "
+                f"{len(tables)} tables"
+            )
+
+        return sections
+
+    async def _read_pages_parallel(
+        self,
+        pdf_path: str,
+        total_pages: int,
+        workers: int,
+        detect_tables: bool,
+    ) -> List[_PageData]:
+        """Read a document's pages in the shared worker pool, one range each.
+
+        If a range fails or the request is cancelled, ranges that haven't
+        started yet are cancelled so they don't hold up other requests.
+
+        Args:
+            pdf_path: Path to PDF file
+            total_pages: Number of pages in the document
+            workers: Number of worker processes (and page ranges)
+            detect_tables: Whether to run table detection
+
+        Returns:
+            Raw page data for every page, in page order
+        """
+        global _extraction_pool
+
+        logger.debug(
+            f"Reading {total_pages} pages in {workers} worker processes"
+        )
+
+        pool = _get_extraction_pool()
+        bounds = [total_pages * i // workers for i in range(workers + 1)]
+
+        # Pool futures are kept so queued ranges can be cancelled right away
+        futures = [
+            pool.submit(
+                _read_page_range,
+                self.backend,
+                pdf_path,
+                start,
+                stop,
+                detect_tables,
+            )
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+
+        try:
+            # gather returns results in submission order, whichever range
+            # finishes first
+            chunks = await asyncio.gather(*map(asyncio.wrap_future, futures))
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next request
+            if _extraction_pool is pool:
+                _extraction_pool = None
+            raise
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        return [page for chunk in chunks for page in chunk]
+
     def _format_tables(self, tables: List[List[List[str]]]) -> str:
         """Format extracted tables as text.
 
@@ -167,16 +488,16 @@ class TextExtractionHandler(BaseWorkflowHandler):
             if not table:
                 continue
 
-            # Format table
-            formatted_rows = []
-            for row in table:
-                if row:
-                    # Filter out None values and join with |
-                    cleaned_row = [str(cell) if cell else "" for cell in row]
-                    formatted_rows.append(" | ".join(cleaned_row))
+            # Format non-empty rows, None cells as empty strings, joined by |
+            formatted_rows = [
+                " | ".join([str(cell) if cell else "" for cell in row])
+                for row in table
+                if row
+            ]
 
             if formatted_rows:
-                table_text = f"TABLE {table_idx}:\n" + "\n".join(formatted_rows)
-                formatted_tables.append(table_text)
+                formatted_tables.append(
+                    f"TABLE {table_idx}:\n" + "\n".join(formatted_rows)
+                )
 
-        return "\n\n".join(formatted_tables) if formatted_tables else ""
+        return "\n\n".join(formatted_tables)
@@ -40,25 +40,9 @@ class WorkflowType(Enum):
         """
         workflow_str = workflow_str.lower().strip()
 
-        # Handle common aliases
-        alias_map = {
-            "default": cls.MISTRAL,
-            "text": cls.TEXT_EXTRACTION,
-            "azure_di": cls.AZURE_DOCUMENT_INTELLIGENCE,
-            "azure-di": cls.AZURE_DOCUMENT_INTELLIGENCE,
-            "azuredi": cls.AZURE_DOCUMENT_INTELLIGENCE,
-            "azure": cls.AZURE_DOCUMENT_INTELLIGENCE,
-            "ocr": cls.OCR_WITH_IMAGES,
-            "ocr_images": cls.OCR_WITH_IMAGES,
-        }
-
-        if workflow_str in alias_map:
-            return alias_map[workflow_str]
-
-        # Try exact match
-        for workflow_type in cls:
-            if workflow_type.value == workflow_str:
-                return workflow_type
+        workflow_type = _WORKFLOW_LOOKUP.get(workflow_str)
+        if workflow_type is not None:
+            return workflow_type
 
         raise ValueError(
             f"Unknown workflow type: {workflow_str}. "
@@ -68,3 +52,16 @@ class WorkflowType(Enum):
     def __str__(self) -> str:
         """Return string representation."""
         return self.value
+
+
+# Every accepted spelling (enum values plus common aliases) mapped to its
+# workflow, so from_string is a single dict lookup
+_WORKFLOW_LOOKUP = {
+    **{workflow_type.value: workflow_type for workflow_type in WorkflowType},
+    "default": WorkflowType.MISTRAL,
+    "text": WorkflowType.TEXT_EXTRACTION,
+    "azure-di": WorkflowType.AZURE_DOCUMENT_INTELLIGENCE,
+    "azuredi": WorkflowType.AZURE_DOCUMENT_INTELLIGENCE,
+    "azure": WorkflowType.AZURE_DOCUMENT_INTELLIGENCE,
+    "ocr": WorkflowType.OCR_WITH_IMAGES,
+}
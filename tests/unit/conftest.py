@@ -0,0 +1,65 @@
+"""
+Shared fixtures for unit tests.
+
+Canned HTTP responses are real httpx.Response objects, built once per session
+and shared read-only across tests.
+"""
+
+import pytest
+import httpx
+
+
+@pytest.fixture(scope="session")
+def response_200():
+    """Successful HTTP response."""
+    return httpx.Response(200, content=b"ok")
+
+
+@pytest.fixture(scope="session")
+def response_400():
+    """Client error HTTP response (not retryable)."""
+    return httpx.Response(400, content=b"bad request")
+
+
+@pytest.fixture(scope="session")
+def response_503():
+    """Service unavailable HTTP response (retryable)."""
+    return httpx.Response(503, content=b"service unavailable")
+
+
+def _async_stub(side_effect=None, return_value=None):
+    """
+    Build a minimal awaitable stand-in for AsyncMock.
+
+    Args:
+        side_effect: Exception to raise on every call, or a list of values to
+                    return (exceptions in the list are raised) one per call
+        return_value: Value returned when no side_effect is given
+
+    Returns:
+        Callable: Async function exposing ``call_count`` and ``calls``, the
+                 list of (args, kwargs) it was awaited with
+    """
+    results = iter(side_effect) if isinstance(side_effect, list) else None
+
+    async def stub(*args, **kwargs):
+        stub.call_count += 1
+        stub.calls.append((args, kwargs))
+        if results is not None:
+            value = next(results)
+            if isinstance(value, BaseException):
+                raise value
+            return value
+        if side_effect is not None:
+            raise side_effect
+        return return_value
+
+    stub.call_count = 0
+    stub.calls = []
+    return stub
+
+
+@pytest.fixture(scope="session")
+def async_stub():
+    """Factory for lightweight async stubs (see ``_async_stub``)."""
+    return _async_stub
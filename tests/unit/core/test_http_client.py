@@ -6,16 +6,46 @@ and request logging.
 """
 
 import pytest
-import httpx
-from unittest.mock import AsyncMock, MagicMock, patch
+import re
+from httpx import NetworkError, Response, TimeoutException
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from src.core.http_client import HTTPClient, get_http_client
 
+_CTX_RE = re.compile("must be used as async context manager")
+
+
+def _make_response(status: int, content: bytes) -> MagicMock:
+    """Build a spec'd httpx.Response mock with a status and body."""
+    response = MagicMock(spec=Response)
+    response.status_code = status
+    response.content = content
+    return response
+
+
+def _make_mock_client(
+    async_stub, verb: str, status: int, content: bytes
+) -> SimpleNamespace:
+    """Build a stub httpx client whose ``verb`` returns a canned response."""
+    mock_response = _make_response(status, content)
+
+    return SimpleNamespace(
+        aclose=async_stub(), **{verb: async_stub(return_value=mock_response)}
+    )
+
 
-@pytest.mark.asyncio
 class TestHTTPClient:
     """Test cases for HTTPClient class."""
 
+    @pytest.fixture(autouse=True)
+    def mock_async_client(self, monkeypatch, async_stub):
+        """Replace httpx.AsyncClient for every test in the class."""
+        mock_async_client = MagicMock()
+        mock_async_client.return_value.aclose = async_stub()
+        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
+        return mock_async_client
+
     async def test_init(self):
         """Test HTTPClient initialization."""
         client = HTTPClient(timeout=60, max_connections=20)
@@ -24,214 +54,132 @@ class TestHTTPClient:
         assert client.max_connections == 20
         assert client.client is None
 
-    async def test_context_manager(self):
+    async def test_context_manager(self, mock_async_client):
         """Test HTTPClient as async context manager."""
         async with HTTPClient(timeout=30) as client:
-            assert client.client is not None
-            assert isinstance(client.client, httpx.AsyncClient)
+            assert client.client is mock_async_client.return_value
+            mock_async_client.assert_called_once()
+            assert mock_async_client.call_args.kwargs["follow_redirects"] is True
 
         # Client should be closed after context exit
-        # We can't directly test if it's closed, but we can verify it existed
-
-    async def test_get_without_context_manager(self):
-        """Test GET request fails without context manager."""
+        assert client.client.aclose.call_count == 1
+
+    @pytest.mark.parametrize(
+        "method,kwargs",
+        [
+            ("get", {}),
+            ("post", {"json": {"key": "value"}}),
+            ("put", {"json": {"key": "value"}}),
+            ("delete", {}),
+        ],
+    )
+    async def test_request_without_context_manager(self, method, kwargs):
+        """Test requests fail without context manager."""
         client = HTTPClient()
 
-        with pytest.raises(RuntimeError, match="must be used as async context manager"):
-            await client.get("https://example.com")
+        with pytest.raises(RuntimeError, match=_CTX_RE):
+            await getattr(client, method)("https://example.com", **kwargs)
 
-    async def test_post_without_context_manager(self):
-        """Test POST request fails without context manager."""
-        client = HTTPClient()
-
-        with pytest.raises(RuntimeError, match="must be used as async context manager"):
-            await client.post("https://example.com", json={"key": "value"})
-
-    async def test_put_without_context_manager(self):
-        """Test PUT request fails without context manager."""
-        client = HTTPClient()
-
-        with pytest.raises(RuntimeError, match="must be used as async context manager"):
-            await client.put("https://example.com", json={"key": "value"})
-
-    async def test_delete_without_context_manager(self):
-        """Test DELETE request fails without context manager."""
-        client = HTTPClient()
-
-        with pytest.raises(RuntimeError, match="must be used as async context manager"):
-            await client.delete("https://example.com")
-
-    @patch("httpx.AsyncClient")
-    async def test_get_request(self, mock_async_client):
-        """Test GET request with mocked httpx client."""
-        # Setup mock response
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.content = b"test content"
-
-        # Setup mock client
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client_instance.aclose = AsyncMock()
-        mock_async_client.return_value = mock_client_instance
-
-        async with HTTPClient() as client:
-            response = await client.get(
-                "https://api.example.com/test",
-                headers={"Authorization": "Bearer token"},
-                params={"page": 1},
-            )
-
-            assert response.status_code == 200
-            assert response.content == b"test content"
-
-            # Verify the call was made correctly
-            mock_client_instance.get.assert_called_once_with(
+    @pytest.mark.parametrize(
+        "verb,url,kwargs,status,content",
+        [
+            (
+                "get",
                 "https://api.example.com/test",
-                headers={"Authorization": "Bearer token"},
-                params={"page": 1},
-            )
-
-    @patch("httpx.AsyncClient")
-    async def test_post_request_with_json(self, mock_async_client):
-        """Test POST request with JSON payload."""
-        # Setup mock response
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.content = b'{"id": 123}'
-
-        # Setup mock client
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.aclose = AsyncMock()
-        mock_async_client.return_value = mock_client_instance
-
-        async with HTTPClient() as client:
-            response = await client.post(
+                {"headers": {"Authorization": "Bearer token"}, "params": {"page": 1}},
+                200,
+                b"test content",
+            ),
+            (
+                "post",
                 "https://api.example.com/create",
-                json={"name": "test"},
-                headers={"Content-Type": "application/json"},
-            )
-
-            assert response.status_code == 201
-
-            # Verify the call
-            mock_client_instance.post.assert_called_once()
-
-    @patch("httpx.AsyncClient")
-    async def test_post_request_with_files(self, mock_async_client):
-        """Test POST request with file upload."""
-        # Setup mock response
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.content = b"uploaded"
-
-        # Setup mock client
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.aclose = AsyncMock()
-        mock_async_client.return_value = mock_client_instance
-
-        async with HTTPClient() as client:
-            response = await client.post(
+                {
+                    "json": {"name": "test"},
+                    "headers": {"Content-Type": "application/json"},
+                },
+                201,
+                b'{"id": 123}',
+            ),
+            (
+                "post",
                 "https://api.example.com/upload",
-                files={"file": ("test.pdf", b"pdf content")},
-            )
-
-            assert response.status_code == 200
-
-    @patch("httpx.AsyncClient")
-    async def test_put_request(self, mock_async_client):
-        """Test PUT request."""
-        # Setup mock response
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.content = b"updated"
-
-        # Setup mock client
-        mock_client_instance = AsyncMock()
-        mock_client_instance.put = AsyncMock(return_value=mock_response)
-        mock_client_instance.aclose = AsyncMock()
-        mock_async_client.return_value = mock_client_instance
-
-        async with HTTPClient() as client:
-            response = await client.put(
-                "https://api.example.com/update/123", json={"status": "active"}
-            )
-
-            assert response.status_code == 200
-
-    @patch("httpx.AsyncClient")
-    async def test_delete_request(self, mock_async_client):
-        """Test DELETE request."""
-        # Setup mock response
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 204
-        mock_response.content = b""
-
-        # Setup mock client
-        mock_client_instance = AsyncMock()
-        mock_client_instance.delete = AsyncMock(return_value=mock_response)
-        mock_client_instance.aclose = AsyncMock()
-        mock_async_client.return_value = mock_client_instance
-
-        async with HTTPClient() as client:
-            response = await client.delete(
+                {"files": {"file": ("test.pdf", b"pdf content")}},
+                200,
+                b"uploaded",
+            ),
+            (
+                "put",
+                "https://api.example.com/update/123",
+                {"json": {"status": "active"}},
+                200,
+                b"updated",
+            ),
+            (
+                "delete",
                 "https://api.example.com/delete/123",
-                headers={"Authorization": "Bearer token"},
-            )
-
-            assert response.status_code == 204
-
-    @patch("httpx.AsyncClient")
-    async def test_http_error_handling(self, mock_async_client):
-        """Test HTTP error handling."""
-        # Setup mock client to raise exception
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(
-            side_effect=httpx.TimeoutException("Request timeout")
-        )
-        mock_client_instance.aclose = AsyncMock()
+                {"headers": {"Authorization": "Bearer token"}},
+                204,
+                b"",
+            ),
+        ],
+        ids=["get", "post_json", "post_files", "put", "delete"],
+    )
+    async def test_request(
+        self, mock_async_client, async_stub, verb, url, kwargs, status, content
+    ):
+        """Test each HTTP verb with mocked httpx client."""
+        mock_client_instance = _make_mock_client(async_stub, verb, status, content)
         mock_async_client.return_value = mock_client_instance
 
         async with HTTPClient() as client:
-            with pytest.raises(httpx.TimeoutException):
-                await client.get("https://api.example.com/slow")
-
-    @patch("httpx.AsyncClient")
-    async def test_network_error_handling(self, mock_async_client):
-        """Test network error handling."""
-        # Setup mock client to raise network error
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post = AsyncMock(
-            side_effect=httpx.NetworkError("Connection failed")
+            response = await getattr(client, verb)(url, **kwargs)
+
+            assert response.status_code == status
+            assert response.content == content
+
+            # Verify the call was forwarded with the given arguments
+            mock_verb = getattr(mock_client_instance, verb)
+            assert mock_verb.call_count == 1
+            call_args, call_kwargs = mock_verb.calls[0]
+            assert call_args == (url,)
+            for key, value in kwargs.items():
+                assert call_kwargs[key] == value
+
+    @pytest.mark.parametrize(
+        "verb,exc",
+        [
+            ("get", TimeoutException("Request timeout")),
+            ("post", NetworkError("Connection failed")),
+        ],
+        ids=["timeout", "network_error"],
+    )
+    async def test_error_handling(self, mock_async_client, async_stub, verb, exc):
+        """Test that httpx errors propagate to the caller."""
+        mock_client_instance = SimpleNamespace(
+            aclose=async_stub(), **{verb: async_stub(side_effect=exc)}
         )
-        mock_client_instance.aclose = AsyncMock()
         mock_async_client.return_value = mock_client_instance
 
         async with HTTPClient() as client:
-            with pytest.raises(httpx.NetworkError):
-                await client.post("https://api.example.com/endpoint", json={})
+            with pytest.raises(type(exc)):
+                await getattr(client, verb)("https://api.example.com/endpoint")
 
 
-@pytest.mark.asyncio
 class TestGetHTTPClient:
     """Test cases for get_http_client convenience function."""
 
     @patch("httpx.AsyncClient")
-    async def test_convenience_function(self, mock_async_client):
+    async def test_convenience_function(self, mock_async_client, async_stub):
         """Test get_http_client convenience function."""
         # Setup mock
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.content = b"success"
+        mock_response = _make_response(200, b"success")
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client_instance.aclose = AsyncMock()
+        mock_client_instance = SimpleNamespace(
+            get=async_stub(return_value=mock_response), aclose=async_stub()
+        )
         mock_async_client.return_value = mock_client_instance
 
         async with get_http_client(timeout=30) as client:
             response = await client.get("https://example.com")
             assert response.status_code == 200
-            assert isinstance(client, HTTPClient)
+            assert type(client) is HTTPClient
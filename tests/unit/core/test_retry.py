@@ -7,8 +7,10 @@ and exception handling.
 
 import pytest
 import asyncio
+import random
+import time
 import httpx
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Dict, List, Tuple
 
 from src.core.retry import (
     RetryConfig,
@@ -23,47 +25,68 @@ from src.core.retry import (
 class TestCalculateBackoff:
     """Test cases for calculate_backoff function."""
 
-    def test_backoff_calculation(self):
-        """Test exponential backoff calculation."""
-        assert calculate_backoff(0, 2) == 2.0
-        assert calculate_backoff(1, 2) == 4.0
-        assert calculate_backoff(2, 2) == 8.0
-        assert calculate_backoff(3, 2) == 16.0
-
-    def test_backoff_with_different_factor(self):
-        """Test backoff with different base factor."""
-        assert calculate_backoff(0, 1) == 1.0
-        assert calculate_backoff(1, 1) == 2.0
-        assert calculate_backoff(2, 1) == 4.0
-
-    def test_backoff_with_fractional_factor(self):
-        """Test backoff with fractional factor."""
-        assert calculate_backoff(0, 0.5) == 0.5
-        assert calculate_backoff(1, 0.5) == 1.0
-        assert calculate_backoff(2, 0.5) == 2.0
+    @pytest.mark.parametrize(
+        "attempt,factor,ceiling",
+        [
+            (0, 2, 2.0),
+            (1, 2, 4.0),
+            (2, 2, 8.0),
+            (3, 2, 16.0),
+            (0, 1, 1.0),
+            (1, 1, 2.0),
+            (2, 1, 4.0),
+            (0, 0.5, 0.5),
+            (1, 0.5, 1.0),
+            (2, 0.5, 2.0),
+        ],
+    )
+    def test_backoff_calculation(
+        self, monkeypatch, attempt, factor, ceiling
+    ):
+        """Test that the delay is drawn between zero and the ceiling."""
+        monkeypatch.setattr(random, "uniform", lambda low, high: (low, high))
+
+        assert calculate_backoff(attempt, factor) == (0, ceiling)
+
+    def test_backoff_is_jittered(self):
+        """Test that repeated calls spread delays instead of repeating."""
+        delays = [calculate_backoff(2, 2) for _ in range(10)]
+
+        assert all(0 <= delay <= 8.0 for delay in delays)
+        assert len(set(delays)) > 1
 
 
 class TestShouldRetryStatus:
     """Test cases for should_retry_status function."""
 
-    def test_retry_status_codes(self):
-        """Test detection of retry-able status codes."""
+    @pytest.mark.parametrize(
+        "status_code,expected",
+        [
+            (429, True),
+            (500, True),
+            (502, True),
+            (503, True),
+            (504, True),
+            (200, False),
+            (400, False),
+            (401, False),
+            (404, False),
+        ],
+    )
+    def test_should_retry_status(self, status_code, expected):
+        """Test detection of retry-able and non-retry-able status codes."""
         retry_codes = [429, 500, 502, 503, 504]
 
-        assert should_retry_status(429, retry_codes) is True
-        assert should_retry_status(500, retry_codes) is True
-        assert should_retry_status(502, retry_codes) is True
-        assert should_retry_status(503, retry_codes) is True
-        assert should_retry_status(504, retry_codes) is True
+        assert should_retry_status(status_code, retry_codes) is expected
 
-    def test_non_retry_status_codes(self):
-        """Test detection of non-retry-able status codes."""
-        retry_codes = [429, 500, 502, 503, 504]
+    def test_bitmask_fast_path(self):
+        """Test that an int bitmask matches list membership for every status."""
+        config = RetryConfig(retry_status_codes=[429, 500, 502, 503, 504])
 
-        assert should_retry_status(200, retry_codes) is False
-        assert should_retry_status(400, retry_codes) is False
-        assert should_retry_status(401, retry_codes) is False
-        assert should_retry_status(404, retry_codes) is False
+        for code in range(100, 600):
+            assert should_retry_status(code, config._status_mask) is (
+                should_retry_status(code, config.retry_status_codes)
+            )
 
 
 class TestRetryConfig:
@@ -89,26 +112,41 @@ class TestRetryConfig:
 
         assert config.max_attempts == 5
         assert config.backoff_factor == 1.5
-        assert config.retry_status_codes == [429, 503]
+        assert config.retry_status_codes == (429, 503)
         assert config.retry_exceptions == (ValueError,)
 
+    def test_status_codes_reassignment_updates_mask(self):
+        """Test that assigning new status codes is honoured by the bitmask."""
+        config = RetryConfig(retry_status_codes=[503])
+
+        config.retry_status_codes = [429]
+
+        assert should_retry_status(429, config._status_mask)
+        assert not should_retry_status(503, config._status_mask)
+
+    def test_status_codes_immutable(self):
+        """Test that status codes can't be changed in place behind the mask."""
+        config = RetryConfig(retry_status_codes=[503])
+
+        with pytest.raises(AttributeError):
+            config.retry_status_codes.append(429)
+
 
-@pytest.mark.asyncio
 class TestRetryAsync:
     """Test cases for retry_async function."""
 
-    async def test_successful_first_attempt(self):
+    async def test_successful_first_attempt(self, async_stub):
         """Test successful execution on first attempt."""
-        mock_func = AsyncMock(return_value="success")
+        mock_func = async_stub(return_value="success")
 
         result = await retry_async(mock_func, RetryConfig(max_attempts=3))
 
         assert result == "success"
         assert mock_func.call_count == 1
 
-    async def test_retry_on_exception(self):
+    async def test_retry_on_exception(self, async_stub):
         """Test retry on exception."""
-        mock_func = AsyncMock(
+        mock_func = async_stub(
             side_effect=[
                 httpx.TimeoutException("timeout"),
                 httpx.TimeoutException("timeout"),
@@ -122,9 +160,9 @@ class TestRetryAsync:
         assert result == "success"
         assert mock_func.call_count == 3
 
-    async def test_max_retries_exceeded(self):
+    async def test_max_retries_exceeded(self, async_stub):
         """Test failure after max retries exceeded."""
-        mock_func = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
+        mock_func = async_stub(side_effect=httpx.TimeoutException("timeout"))
 
         config = RetryConfig(max_attempts=3, backoff_factor=0.01)
 
@@ -133,9 +171,38 @@ class TestRetryAsync:
 
         assert mock_func.call_count == 3
 
-    async def test_non_retryable_exception(self):
+    async def test_max_retries_exceeded_logged(self, async_stub, caplog):
+        """Test that a failing final attempt is logged before it propagates."""
+        mock_func = async_stub(side_effect=httpx.TimeoutException("timeout"))
+
+        config = RetryConfig(max_attempts=2, backoff_factor=0.01)
+
+        with pytest.raises(httpx.TimeoutException):
+            await retry_async(mock_func, config)
+
+        assert "Request failed - max retries reached" in caplog.messages
+
+    async def test_non_retryable_on_final_attempt_logged(self, async_stub, caplog):
+        """Test that a non-retryable error on the last attempt is still logged."""
+        mock_func = async_stub(side_effect=ValueError("bad value"))
+
+        with pytest.raises(ValueError, match="bad value"):
+            await retry_async(mock_func, RetryConfig(max_attempts=1))
+
+        assert "Non-retryable exception" in caplog.messages
+
+    async def test_zero_attempts_never_calls(self, async_stub):
+        """Test that max_attempts=0 does not call the function at all."""
+        mock_func = async_stub(return_value="success")
+
+        result = await retry_async(mock_func, RetryConfig(max_attempts=0))
+
+        assert result is None
+        assert mock_func.call_count == 0
+
+    async def test_non_retryable_exception(self, async_stub):
         """Test immediate failure on non-retryable exception."""
-        mock_func = AsyncMock(side_effect=ValueError("bad value"))
+        mock_func = async_stub(side_effect=ValueError("bad value"))
 
         config = RetryConfig(max_attempts=3, backoff_factor=0.01)
 
@@ -145,18 +212,9 @@ class TestRetryAsync:
         # Should fail immediately, not retry
         assert mock_func.call_count == 1
 
-    async def test_retry_on_status_code(self):
+    async def test_retry_on_status_code(self, async_stub, response_200, response_503):
         """Test retry on specific HTTP status codes."""
-        # Create mock responses
-        response_503 = MagicMock(spec=httpx.Response)
-        response_503.status_code = 503
-        response_503.content = b"service unavailable"
-
-        response_200 = MagicMock(spec=httpx.Response)
-        response_200.status_code = 200
-        response_200.content = b"success"
-
-        mock_func = AsyncMock(side_effect=[response_503, response_503, response_200])
+        mock_func = async_stub(side_effect=[response_503, response_503, response_200])
 
         config = RetryConfig(
             max_attempts=3, backoff_factor=0.01, retry_status_codes=[503]
@@ -167,13 +225,9 @@ class TestRetryAsync:
         assert result.status_code == 200
         assert mock_func.call_count == 3
 
-    async def test_non_retry_status_code(self):
+    async def test_non_retry_status_code(self, async_stub, response_400):
         """Test no retry on non-retry-able status codes."""
-        response_400 = MagicMock(spec=httpx.Response)
-        response_400.status_code = 400
-        response_400.content = b"bad request"
-
-        mock_func = AsyncMock(return_value=response_400)
+        mock_func = async_stub(return_value=response_400)
 
         config = RetryConfig(
             max_attempts=3,
@@ -187,11 +241,9 @@ class TestRetryAsync:
         assert result.status_code == 400
         assert mock_func.call_count == 1
 
-    async def test_backoff_timing(self):
+    async def test_backoff_timing(self, async_stub):
         """Test that exponential backoff actually waits."""
-        import time
-
-        mock_func = AsyncMock(
+        mock_func = async_stub(
             side_effect=[httpx.TimeoutException("timeout"), "success"]
         )
 
@@ -201,12 +253,10 @@ class TestRetryAsync:
         await retry_async(mock_func, config)
         elapsed = time.time() - start
 
-        # First backoff should be ~0.1 seconds
-        assert elapsed >= 0.09
-        assert elapsed < 0.5
+        # First backoff is jittered within [0, 0.1] seconds
+        assert elapsed < 0.2
 
 
-@pytest.mark.asyncio
 class TestWithRetryDecorator:
     """Test cases for with_retry decorator."""
 
@@ -258,119 +308,172 @@ class TestWithRetryDecorator:
         assert documented_func.__name__ == "documented_func"
         assert "documented function" in documented_func.__doc__
 
+    async def test_decorator_retries_on_status_code(self, response_200, response_503):
+        """Test that the decorator retries retryable status codes."""
+        responses = iter([response_503, response_200])
+
+        @with_retry(max_attempts=3, backoff_factor=0.01, retry_status_codes=[503])
+        async def fetch():
+            return next(responses)
+
+        result = await fetch()
+
+        assert result.status_code == 200
+
+    async def test_decorator_non_retryable_exception(self):
+        """Test that non-retryable exceptions fail on the first attempt."""
+        call_count = 0
+
+        @with_retry(max_attempts=3, backoff_factor=0.01)
+        async def broken():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("bad value")
+
+        with pytest.raises(ValueError, match="bad value"):
+            await broken()
+
+        assert call_count == 1
+
+
+class _CannedTransport:
+    """
+    Serve canned replies keyed by (method, url), consumed in order.
+
+    Entries that are exceptions are raised from the transport instead of
+    returned. Every request is recorded in ``sent``.
+    """
+
+    def __init__(self):
+        """Start with no canned replies and nothing sent."""
+        self.replies: Dict[Tuple[str, str], list] = {}
+        self.sent: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Record the request and serve its next canned reply."""
+        self.sent.append(request)
+        reply = self.replies[(request.method, str(request.url))].pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+@pytest.fixture
+def transport():
+    """Fresh canned-reply transport for one test."""
+    return _CannedTransport()
+
+
+@pytest.fixture
+def replies(transport):
+    """The test's canned-reply table."""
+    return transport.replies
+
+
+@pytest.fixture
+def sent(transport):
+    """Requests the test's client has sent, in order."""
+    return transport.sent
+
+
+@pytest.fixture
+async def http_client(transport):
+    """Real httpx client backed by the canned-reply transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+    yield client
+    await client.aclose()
+
 
-@pytest.mark.asyncio
 class TestRetryableHTTPClient:
     """Test cases for RetryableHTTPClient class."""
 
-    async def test_init(self):
+    async def test_init(self, http_client):
         """Test RetryableHTTPClient initialization."""
-        mock_client = MagicMock()
-        retry_client = RetryableHTTPClient(mock_client)
+        retry_client = RetryableHTTPClient(http_client)
 
-        assert retry_client.http_client is mock_client
+        assert retry_client.http_client is http_client
         assert retry_client.config is not None
 
-    async def test_init_with_custom_config(self):
+    async def test_init_with_custom_config(self, http_client):
         """Test initialization with custom config."""
-        mock_client = MagicMock()
         config = RetryConfig(max_attempts=5, backoff_factor=1.5)
-        retry_client = RetryableHTTPClient(mock_client, config=config)
+        retry_client = RetryableHTTPClient(http_client, config=config)
 
         assert retry_client.config.max_attempts == 5
         assert retry_client.config.backoff_factor == 1.5
 
-    async def test_get_with_retry(self):
+    async def test_get_with_retry(self, http_client, replies, sent):
         """Test GET request with retry."""
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(
-            side_effect=[
-                httpx.TimeoutException("timeout"),
-                MagicMock(status_code=200, content=b"success"),
-            ]
-        )
+        replies[("GET", "https://api.example.com")] = [
+            httpx.TimeoutException("timeout"),
+            httpx.Response(200, content=b"success"),
+        ]
 
         config = RetryConfig(max_attempts=3, backoff_factor=0.01)
-        retry_client = RetryableHTTPClient(mock_client, config=config)
+        retry_client = RetryableHTTPClient(http_client, config=config)
 
         response = await retry_client.get("https://api.example.com")
 
         assert response.status_code == 200
-        assert mock_client.get.call_count == 2
+        assert len(sent) == 2
 
-    async def test_post_with_retry(self):
+    async def test_post_with_retry(self, http_client, replies, sent):
         """Test POST request with retry."""
-        mock_client = MagicMock()
-
-        response_503 = MagicMock(spec=httpx.Response)
-        response_503.status_code = 503
-        response_503.content = b"unavailable"
-
-        response_200 = MagicMock(spec=httpx.Response)
-        response_200.status_code = 200
-        response_200.content = b"success"
-
-        mock_client.post = AsyncMock(side_effect=[response_503, response_200])
+        replies[("POST", "https://api.example.com")] = [
+            httpx.Response(503, content=b"unavailable"),
+            httpx.Response(200, content=b"success"),
+        ]
 
         config = RetryConfig(
             max_attempts=3, backoff_factor=0.01, retry_status_codes=[503]
         )
-        retry_client = RetryableHTTPClient(mock_client, config=config)
+        retry_client = RetryableHTTPClient(http_client, config=config)
 
         response = await retry_client.post(
             "https://api.example.com", json={"data": "test"}
         )
 
         assert response.status_code == 200
-        assert mock_client.post.call_count == 2
+        assert len(sent) == 2
 
-    async def test_put_with_retry(self):
+    async def test_put_with_retry(self, http_client, replies, sent):
         """Test PUT request with retry."""
-        mock_client = MagicMock()
-        mock_client.put = AsyncMock(
-            return_value=MagicMock(status_code=200, content=b"updated")
-        )
+        replies[("PUT", "https://api.example.com")] = [
+            httpx.Response(200, content=b"updated")
+        ]
 
-        retry_client = RetryableHTTPClient(mock_client)
+        retry_client = RetryableHTTPClient(http_client)
 
         response = await retry_client.put(
             "https://api.example.com", json={"status": "active"}
         )
 
         assert response.status_code == 200
-        assert mock_client.put.call_count == 1
+        assert len(sent) == 1
 
-    async def test_delete_with_retry(self):
+    async def test_delete_with_retry(self, http_client, replies, sent):
         """Test DELETE request with retry."""
-        mock_client = MagicMock()
-        mock_client.delete = AsyncMock(
-            return_value=MagicMock(status_code=204, content=b"")
-        )
+        replies[("DELETE", "https://api.example.com/123")] = [httpx.Response(204)]
 
-        retry_client = RetryableHTTPClient(mock_client)
+        retry_client = RetryableHTTPClient(http_client)
 
         response = await retry_client.delete("https://api.example.com/123")
 
         assert response.status_code == 204
-        assert mock_client.delete.call_count == 1
+        assert len(sent) == 1
 
-    async def test_all_methods_support_kwargs(self):
+    async def test_all_methods_support_kwargs(self, http_client, replies, sent):
         """Test that all methods pass through kwargs correctly."""
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(
-            return_value=MagicMock(status_code=200, content=b"ok")
-        )
-        mock_client.post = AsyncMock(
-            return_value=MagicMock(status_code=201, content=b"created")
-        )
+        replies[("GET", "https://api.example.com")] = [httpx.Response(200)]
+        replies[("POST", "https://api.example.com")] = [httpx.Response(201)]
 
-        retry_client = RetryableHTTPClient(mock_client)
+        retry_client = RetryableHTTPClient(http_client)
 
         # Test GET with headers
         await retry_client.get(
             "https://api.example.com", headers={"Authorization": "Bearer token"}
         )
-        mock_client.get.assert_called_once()
+        assert sent[-1].headers["Authorization"] == "Bearer token"
 
         # Test POST with json and headers
         await retry_client.post(
@@ -378,4 +481,37 @@ class TestRetryableHTTPClient:
             json={"data": "test"},
             headers={"Content-Type": "application/json"},
         )
-        mock_client.post.assert_called_once()
+        assert sent[-1].headers["Content-Type"] == "application/json"
+        assert sent[-1].content == b'{"data": "test"}'
+
+    async def test_concurrent_backoffs_wait_own_delay(
+        self, http_client, replies, monkeypatch
+    ):
+        """Test that a retry never wakes early on another request's shorter delay."""
+        replies[("GET", "https://api.example.com")] = [
+            httpx.TimeoutException("timeout"),
+            httpx.TimeoutException("timeout"),
+            httpx.Response(200),
+            httpx.Response(200),
+        ]
+        # Take the jitter ceiling so each delay is exactly backoff_factor
+        monkeypatch.setattr(random, "uniform", lambda low, high: high)
+
+        fast = RetryableHTTPClient(
+            http_client, config=RetryConfig(max_attempts=2, backoff_factor=0.01)
+        )
+        slow = RetryableHTTPClient(
+            http_client, config=RetryConfig(max_attempts=2, backoff_factor=0.2)
+        )
+
+        async def timed_get(client):
+            start = time.monotonic()
+            await client.get("https://api.example.com")
+            return time.monotonic() - start
+
+        fast_elapsed, slow_elapsed = await asyncio.gather(
+            timed_get(fast), timed_get(slow)
+        )
+
+        assert fast_elapsed < 0.2
+        assert slow_elapsed >= 0.2
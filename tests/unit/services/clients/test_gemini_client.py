@@ -5,67 +5,70 @@ Tests the Google Gemini AI client.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import httpx
+import respx
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from src.services.clients.gemini_client import GeminiClient
-from src.core.error_handling import ConfigurationError, APIClientError
+from src.core.config import settings
+from src.core.error_handling import (
+    APIClientError,
+    ConfigurationError,
+    FileProcessingError,
+)
+from src.core.rate_limiter import get_provider_limiter
+
+_GEMINI_REPLY = {
+    "candidates": [{"content": {"parts": [{"text": "Extracted content from Gemini"}]}}]
+}
+
+
+@pytest.fixture
+def generate_content():
+    """respx route for Gemini generateContent; answers with a canned reply."""
+    with respx.mock(
+        base_url="https://generativelanguage.googleapis.com/v1beta",
+        assert_all_called=False,
+    ) as router:
+        yield router.post("/models/gemini-pro:generateContent").respond(
+            200, json=_GEMINI_REPLY
+        )
+
+
+@pytest.fixture
+async def client(generate_content):
+    """GeminiClient whose pooled httpx client is served by respx."""
+    # Real rate limiter, refilled so earlier tests can't make us wait
+    get_provider_limiter().reset("gemini")
+    client = GeminiClient(api_key="test_key")
+    yield client
+    await client.aclose()
 
 
-@pytest.mark.asyncio
 class TestGeminiClient:
     """Test cases for GeminiClient."""
 
-    @patch("src.services.clients.gemini_client.get_provider_limiter")
-    def test_init_success(self, mock_limiter):
+    def test_init_success(self, client):
         """Test successful initialization."""
-        mock_limiter.return_value.get.return_value = MagicMock()
-
-        client = GeminiClient(api_key="test_key")
-
         assert client.api_key == "test_key"
         assert client.model == "gemini-pro"
         assert client.provider_name == "gemini"
         assert client.timeout == 120.0
 
-    @patch("src.services.clients.gemini_client.get_provider_limiter")
-    def test_init_missing_api_key(self, mock_limiter):
+    def test_init_missing_api_key(self, monkeypatch):
         """Test initialization with missing API key."""
-        mock_limiter.return_value.get.return_value = MagicMock()
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        monkeypatch.setattr(settings, "GEMINI_API_KEY", None)
 
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(ConfigurationError, match="Gemini API key"):
-                GeminiClient(api_key=None)
+        with pytest.raises(ConfigurationError, match="Gemini API key"):
+            GeminiClient(api_key=None)
 
-    @patch("src.services.clients.gemini_client.get_provider_limiter")
-    @patch("src.services.clients.gemini_client.HTTPClient")
-    async def test_extract_page_content(self, mock_http_client, mock_limiter):
+    async def test_extract_page_content(self, client):
         """Test single page extraction."""
-        # Setup mocks
-        mock_rate_limiter = MagicMock()
-        mock_rate_limiter.__aenter__ = AsyncMock(return_value=None)
-        mock_rate_limiter.__aexit__ = AsyncMock(return_value=None)
-        mock_limiter.return_value.get.return_value = mock_rate_limiter
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-        mock_response.json = MagicMock(
-            return_value={
-                "candidates": [
-                    {"content": {"parts": [{"text": "Extracted content from Gemini"}]}}
-                ]
-            }
-        )
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
-
-        # Create client and test
-        client = GeminiClient(api_key="test_key")
-
         section = await client.extract_page_content(
             page_data={"text": "Sample text"}, query="Extract data", page_number=1
         )
@@ -75,22 +78,131 @@ class TestGeminiClient:
         assert section.metadata["provider"] == "gemini"
         assert section.metadata["model"] == "gemini-pro"
 
-    @patch("src.services.clients.gemini_client.get_provider_limiter")
-    @patch("src.services.clients.gemini_client.HTTPClient")
-    async def test_health_check_healthy(self, mock_http_client, mock_limiter):
-        """Test health check with healthy API."""
-        mock_limiter.return_value.get.return_value = MagicMock()
+    async def test_http_client_reused_across_pages(self, client, generate_content):
+        """Test that every page goes through the same pooled client."""
+        http = client._http
+
+        for page_number in (1, 2, 3):
+            await client.extract_page_content(
+                page_data={"text": "text"}, query="Extract", page_number=page_number
+            )
+
+        assert client._http is http
+        assert [call.request.url.path for call in generate_content.calls] == [
+            "/v1beta/models/gemini-pro:generateContent"
+        ] * 3
+
+    async def test_endpoint_precomputed(self, client, generate_content):
+        """Test that the endpoint, key and headers are built once and sent."""
+        assert client._endpoint.endswith(":generateContent")
+
+        await client.extract_page_content(
+            page_data={"text": "text"}, query="Extract", page_number=1
+        )
+
+        request = generate_content.calls.last.request
+        assert request.url.params["key"] == "test_key"
+        assert request.headers["Content-Type"] == "application/json"
+
+    @patch("pdfplumber.open")
+    async def test_process_document_concurrent(self, mock_open, client):
+        """Test that pages are extracted concurrently and returned in order."""
+        pages = [
+            SimpleNamespace(extract_text=lambda n=n: f"page {n}") for n in range(1, 11)
+        ]
+        mock_open.return_value.__enter__.return_value = MagicMock(pages=pages)
+
+        async def slow_extract(page_data, query, page_number):
+            await asyncio.sleep(0.1)
+            return page_data["text"]
+
+        client.extract_page_content = slow_extract
+
+        start = time.monotonic()
+        sections = await client.process_document("doc.pdf", "Extract", chunk_size=10)
+        elapsed = time.monotonic() - start
+
+        assert sections == [f"page {n}" for n in range(1, 11)]
+        assert elapsed < len(pages) * 0.1 / 2
+
+    @patch("pdfplumber.open")
+    async def test_process_document_reads_off_event_loop(
+        self, mock_open, client
+    ):
+        """Test that the PDF is opened and read in a worker thread."""
+        threads = []
+        def extract_text():
+            threads.append(threading.get_ident())
+            return "text"
+
+        pages = [SimpleNamespace(extract_text=extract_text) for _ in range(3)]
+        document = MagicMock()
+        document.__enter__.return_value = MagicMock(pages=pages)
+        mock_open.side_effect = lambda path: (
+            threads.append(threading.get_ident()) or document
+        )
+
+        async def extract(page_data, query, page_number):
+            return page_number
+
+        client.extract_page_content = extract
+
+        sections = await client.process_document("doc.pdf", "Extract")
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        assert sections == [1, 2, 3]
+        assert len(threads) == 4  # open, then three pages
+        assert len(set(threads)) == 1
+        assert threads[0] != threading.get_ident()
 
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
+    @patch("pdfplumber.open")
+    async def test_process_document_failure_cancels_other_pages(
+        self, mock_open, client
+    ):
+        """Test that one failing page cancels the page requests still running."""
+        pages = [SimpleNamespace(extract_text=lambda: "text") for _ in range(5)]
+        mock_open.return_value.__enter__.return_value = MagicMock(pages=pages)
+        cancelled = []
 
-        client = GeminiClient(api_key="test_key")
+        async def extract(page_data, query, page_number):
+            if page_number == 1:
+                raise APIClientError("Gemini extraction failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(page_number)
+                raise
+
+        client.extract_page_content = extract
+
+        with pytest.raises(FileProcessingError, match="Gemini extraction failed"):
+            await client.process_document("doc.pdf", "Extract")
+
+        assert sorted(cancelled) == [2, 3, 4, 5]
+
+    @patch("pdfplumber.open")
+    async def test_process_document_concurrency_limit(self, mock_open, client):
+        """Test that chunk_size caps the number of page requests in flight."""
+        pages = [SimpleNamespace(extract_text=lambda: "text") for _ in range(6)]
+        mock_open.return_value.__enter__.return_value = MagicMock(pages=pages)
+        in_flight = peak = 0
+
+        async def extract(page_data, query, page_number):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return page_number
+
+        client.extract_page_content = extract
+
+        sections = await client.process_document("doc.pdf", "Extract", chunk_size=2)
+
+        assert sections == [1, 2, 3, 4, 5, 6]
+        assert peak == 2
+
+    async def test_health_check_healthy(self, client):
+        """Test health check with healthy API."""
         health = await client.health_check()
 
         assert health["status"] == "healthy"
@@ -98,51 +210,49 @@ class TestGeminiClient:
         assert health["model"] == "gemini-pro"
         assert "latency_ms" in health
 
-    @patch("src.services.clients.gemini_client.get_provider_limiter")
-    @patch("src.services.clients.gemini_client.HTTPClient")
-    async def test_health_check_unhealthy(self, mock_http_client, mock_limiter):
+    async def test_health_check_unhealthy(self, client, generate_content):
         """Test health check with unhealthy API."""
-        mock_limiter.return_value.get.return_value = MagicMock()
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(side_effect=Exception("Connection error"))
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
+        generate_content.side_effect = RuntimeError("Connection error")
 
-        client = GeminiClient(api_key="test_key")
         health = await client.health_check()
 
         assert health["status"] == "unhealthy"
         assert "error" in health
 
-    @patch("src.services.clients.gemini_client.get_provider_limiter")
-    @patch("src.services.clients.gemini_client.HTTPClient")
-    async def test_extraction_api_error(self, mock_http_client, mock_limiter):
+    async def test_extraction_api_error(self, client, generate_content):
         """Test extraction with API error."""
-        # Setup mocks
-        mock_rate_limiter = MagicMock()
-        mock_rate_limiter.__aenter__ = AsyncMock(return_value=None)
-        mock_rate_limiter.__aexit__ = AsyncMock(return_value=None)
-        mock_limiter.return_value.get.return_value = mock_rate_limiter
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(side_effect=Exception("API Error"))
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
-
-        client = GeminiClient(api_key="test_key")
+        generate_content.side_effect = RuntimeError("API Error")
 
         with pytest.raises(APIClientError, match="Gemini extraction failed"):
             await client.extract_page_content(
                 page_data={"text": "test"}, query="Extract", page_number=1
             )
 
-    def test_build_prompt(self):
-        """Test prompt building."""
-        client = GeminiClient(api_key="test_key")
+    async def test_context_manager_keeps_http_client_open(self, client):
+        """Test that a shared client stays usable after leaving the context."""
+        async with client:
+            pass
+
+        assert not client._http.is_closed
+
+    async def test_aclose_closes_owned_http_client(self, client):
+        """Test that aclose closes a pool the client created itself."""
+        await client.aclose()
 
+        assert client._http.is_closed
+
+    async def test_aclose_leaves_passed_http_client_open(self):
+        """Test that aclose does not close a pool owned by the caller."""
+        http = httpx.AsyncClient()
+        client = GeminiClient(api_key="test_key", http_client=http)
+
+        await client.aclose()
+
+        assert not http.is_closed
+        await http.aclose()
+
+    def test_build_prompt(self, client):
+        """Test prompt building."""
         prompt = client._build_prompt(
             query="Extract tables", page_text="Page content here", page_number=5
         )
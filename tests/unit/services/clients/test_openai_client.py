@@ -5,70 +5,68 @@ Tests the OpenAI GPT-4o client with vision API support.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-import base64
+import json
+import respx
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+from src.services.clients import openai_client as oc_mod
 from src.services.clients.openai_client import OpenAIClient
+from src.core.config import settings
 from src.core.error_handling import ConfigurationError, APIClientError
 
 
-@pytest.mark.asyncio
+# Stand-in for the provider limiter registry; MagicMock limiters support
+# ``async with`` and never wait.
+_FAKE_LIMITERS = SimpleNamespace(get=lambda provider: MagicMock())
+
+
+@pytest.fixture(scope="module")
+def openai_client():
+    """One OpenAIClient, built with a stubbed rate limiter, shared by the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(oc_mod, "get_provider_limiter", lambda: _FAKE_LIMITERS)
+        yield OpenAIClient(api_key="test_key")
+
+
+def _completion(content: str) -> dict:
+    """Build a chat completions response body carrying ``content``."""
+    return {"choices": [{"message": {"content": content}}]}
+
+
+@pytest.fixture
+def chat_completions():
+    """respx route for the chat completions endpoint; tests set its response."""
+    with respx.mock(base_url="https://api.openai.com/v1") as router:
+        yield router.post("/chat/completions")
+
+
 class TestOpenAIClient:
     """Test cases for OpenAIClient."""
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    def test_init_success(self, mock_limiter):
+    def test_init_success(self, openai_client):
         """Test successful initialization."""
-        mock_limiter.return_value.get.return_value = MagicMock()
-
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"}, clear=False):
-            client = OpenAIClient(api_key="test_key")
+        assert openai_client.api_key == "test_key"
+        assert openai_client.model == "gpt-4o"
+        assert openai_client.provider_name == "openai"
+        assert openai_client.timeout == 120.0
 
-            assert client.api_key == "test_key"
-            assert client.model == "gpt-4o"
-            assert client.provider_name == "openai"
-            assert client.timeout == 120.0
-
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    def test_init_missing_api_key(self, mock_limiter):
+    def test_init_missing_api_key(self, monkeypatch):
         """Test initialization with missing API key."""
-        mock_limiter.return_value.get.return_value = MagicMock()
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", None)
+        monkeypatch.setattr(oc_mod, "get_provider_limiter", lambda: _FAKE_LIMITERS)
 
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(ConfigurationError, match="OpenAI API key"):
-                OpenAIClient(api_key=None)
+        with pytest.raises(ConfigurationError, match="OpenAI API key"):
+            OpenAIClient(api_key=None)
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    @patch("src.services.clients.openai_client.HTTPClient")
-    async def test_extract_with_vision(self, mock_http_client, mock_limiter):
+    async def test_extract_with_vision(self, openai_client, chat_completions):
         """Test vision-based extraction."""
-        # Setup mocks
-        mock_rate_limiter = MagicMock()
-        mock_rate_limiter.__aenter__ = AsyncMock(return_value=None)
-        mock_rate_limiter.__aexit__ = AsyncMock(return_value=None)
-        mock_limiter.return_value.get.return_value = mock_rate_limiter
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-        mock_response.json = MagicMock(
-            return_value={
-                "choices": [{"message": {"content": "Extracted text from image"}}]
-            }
-        )
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
-
-        # Create client
-        client = OpenAIClient(api_key="test_key")
+        chat_completions.respond(200, json=_completion("Extracted text from image"))
 
         # Test extraction with image
         image_bytes = b"fake image data"
-        section = await client.extract_page_content(
+        section = await openai_client.extract_page_content(
             page_data={"image": image_bytes}, query="Extract text", page_number=1
         )
 
@@ -77,34 +75,17 @@ class TestOpenAIClient:
         assert section.metadata["provider"] == "openai"
         assert section.metadata["has_image"] is True
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    @patch("src.services.clients.openai_client.HTTPClient")
-    async def test_extract_with_text(self, mock_http_client, mock_limiter):
-        """Test text-based extraction (fallback)."""
-        # Setup mocks
-        mock_rate_limiter = MagicMock()
-        mock_rate_limiter.__aenter__ = AsyncMock(return_value=None)
-        mock_rate_limiter.__aexit__ = AsyncMock(return_value=None)
-        mock_limiter.return_value.get.return_value = mock_rate_limiter
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-        mock_response.json = MagicMock(
-            return_value={"choices": [{"message": {"content": "Extracted from text"}}]}
-        )
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
+        # The real HTTPClient built and sent the request
+        request = chat_completions.calls.last.request
+        assert request.headers["Authorization"] == "Bearer test_key"
+        assert json.loads(request.content)["model"] == "gpt-4o"
 
-        # Create client
-        client = OpenAIClient(api_key="test_key")
+    async def test_extract_with_text(self, openai_client, chat_completions):
+        """Test text-based extraction (fallback)."""
+        chat_completions.respond(200, json=_completion("Extracted from text"))
 
         # Test extraction with text
-        section = await client.extract_page_content(
+        section = await openai_client.extract_page_content(
             page_data={"text": "Sample text"}, query="Extract data", page_number=1
         )
 
@@ -112,90 +93,42 @@ class TestOpenAIClient:
         assert section.content == "Extracted from text"
         assert section.metadata["has_image"] is False
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    async def test_extract_missing_data(self, mock_limiter):
+    async def test_extract_missing_data(self, openai_client):
         """Test extraction with missing page data."""
-        mock_limiter.return_value.get.return_value = MagicMock()
-
-        client = OpenAIClient(api_key="test_key")
-
         with pytest.raises(ValueError, match="must contain 'image' or 'text'"):
-            await client.extract_page_content(
+            await openai_client.extract_page_content(
                 page_data={}, query="Extract", page_number=1
             )
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    async def test_process_document_not_implemented(self, mock_limiter):
+    async def test_process_document_not_implemented(self, openai_client):
         """Test that process_document raises NotImplementedError."""
-        mock_limiter.return_value.get.return_value = MagicMock()
-
-        client = OpenAIClient(api_key="test_key")
-
         with pytest.raises(NotImplementedError, match="PDF to image conversion"):
-            await client.process_document("test.pdf", "Extract all")
+            await openai_client.process_document("test.pdf", "Extract all")
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    @patch("src.services.clients.openai_client.HTTPClient")
-    async def test_health_check_healthy(self, mock_http_client, mock_limiter):
+    async def test_health_check_healthy(self, openai_client, chat_completions):
         """Test health check with healthy API."""
-        mock_limiter.return_value.get.return_value = MagicMock()
+        chat_completions.respond(200, json=_completion("ok"))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
-
-        client = OpenAIClient(api_key="test_key")
-        health = await client.health_check()
+        health = await openai_client.health_check()
 
         assert health["status"] == "healthy"
         assert health["provider"] == "openai"
         assert "latency_ms" in health
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    @patch("src.services.clients.openai_client.HTTPClient")
-    async def test_health_check_unhealthy(self, mock_http_client, mock_limiter):
+    async def test_health_check_unhealthy(self, openai_client, chat_completions):
         """Test health check with unhealthy API."""
-        mock_limiter.return_value.get.return_value = MagicMock()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 503
+        chat_completions.respond(503)
 
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
-
-        client = OpenAIClient(api_key="test_key")
-        health = await client.health_check()
+        health = await openai_client.health_check()
 
         assert health["status"] == "unhealthy"
         assert "error" in health
 
-    @patch("src.services.clients.openai_client.get_provider_limiter")
-    @patch("src.services.clients.openai_client.HTTPClient")
-    async def test_extraction_api_error(self, mock_http_client, mock_limiter):
+    async def test_extraction_api_error(self, openai_client, chat_completions):
         """Test extraction with API error."""
-        # Setup mocks
-        mock_rate_limiter = MagicMock()
-        mock_rate_limiter.__aenter__ = AsyncMock(return_value=None)
-        mock_rate_limiter.__aexit__ = AsyncMock(return_value=None)
-        mock_limiter.return_value.get.return_value = mock_rate_limiter
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.post = AsyncMock(side_effect=Exception("API Error"))
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_http_client.return_value = mock_client_instance
-
-        client = OpenAIClient(api_key="test_key")
+        chat_completions.side_effect = RuntimeError("API Error")
 
         with pytest.raises(APIClientError, match="OpenAI vision extraction failed"):
-            await client.extract_page_content(
+            await openai_client.extract_page_content(
                 page_data={"image": b"data"}, query="Extract", page_number=1
             )
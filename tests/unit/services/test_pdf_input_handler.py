@@ -7,27 +7,35 @@ Tests PDF file upload and base64 decoding.
 import pytest
 import base64
 import os
+import tempfile
 
 from src.services.pdf_input_handler import PDFInputHandler
 
+# Minimal valid PDF, encoded once for every test
+_PDF_BYTES = b"%PDF-1.4\n%%EOF"
+_B64_PDF = base64.b64encode(_PDF_BYTES).decode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def _fast_tmp(tmp_path, monkeypatch):
+    """Write temp PDFs under pytest's per-test directory instead of the OS one."""
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
 
 class TestPDFInputHandler:
     """Test cases for PDFInputHandler."""
 
-    @pytest.mark.asyncio
-    async def test_decode_base64_pdf_valid(self):
+    async def test_decode_base64_pdf_valid(self, tmp_path):
         """Test decoding valid base64 PDF."""
         handler = PDFInputHandler()
 
-        # Create minimal valid PDF
-        pdf_content = b"%PDF-1.4\n%Test PDF\n%%EOF"
-        base64_content = base64.b64encode(pdf_content).decode("utf-8")
-
         # Decode
-        pdf_path = handler.decode_base64_pdf(base64_content, filename="test.pdf")
+        pdf_path = handler.decode_base64_pdf(_B64_PDF, filename="test.pdf")
 
         # Verify
         assert os.path.exists(pdf_path)
+        assert os.path.dirname(pdf_path) == str(tmp_path)
         assert pdf_path in handler.temp_files
 
         # Cleanup
@@ -63,17 +71,13 @@ class TestPDFInputHandler:
         assert not handler._is_valid_pdf(b"Not a PDF")
         assert not handler._is_valid_pdf(b"")
 
-    @pytest.mark.asyncio
     async def test_cleanup_multiple_files(self):
         """Test cleanup of multiple temp files."""
         handler = PDFInputHandler()
 
         # Create multiple files
-        pdf_content = b"%PDF-1.4\n%%EOF"
-        base64_content = base64.b64encode(pdf_content).decode("utf-8")
-
-        path1 = handler.decode_base64_pdf(base64_content)
-        path2 = handler.decode_base64_pdf(base64_content)
+        path1 = handler.decode_base64_pdf(_B64_PDF)
+        path2 = handler.decode_base64_pdf(_B64_PDF)
 
         # Verify both exist
         assert os.path.exists(path1)
@@ -88,14 +92,10 @@ class TestPDFInputHandler:
         assert not os.path.exists(path2)
         assert len(handler.temp_files) == 0
 
-    @pytest.mark.asyncio
     async def test_context_manager(self):
         """Test async context manager."""
-        pdf_content = b"%PDF-1.4\n%%EOF"
-        base64_content = base64.b64encode(pdf_content).decode("utf-8")
-
         async with PDFInputHandler() as handler:
-            pdf_path = handler.decode_base64_pdf(base64_content)
+            pdf_path = handler.decode_base64_pdf(_B64_PDF)
             assert os.path.exists(pdf_path)
 
         # Should be cleaned up after exiting context
@@ -104,10 +104,8 @@ class TestPDFInputHandler:
     def test_get_temp_files(self):
         """Test getting list of temp files."""
         handler = PDFInputHandler()
-        pdf_content = b"%PDF-1.4\n%%EOF"
-        base64_content = base64.b64encode(pdf_content).decode("utf-8")
 
-        path = handler.decode_base64_pdf(base64_content)
+        path = handler.decode_base64_pdf(_B64_PDF)
         temp_files = handler.get_temp_files()
 
         assert path in temp_files
@@ -5,7 +5,7 @@ Tests the central orchestration of workflow execution.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from src.services.workflow_orchestrator import (
     WorkflowOrchestrator,
@@ -14,9 +14,38 @@ from src.services.workflow_orchestrator import (
 from src.workflows.workflow_types import WorkflowType
 from src.models.workflow_models import WorkflowResult, ExtractedSection
 from src.core.error_handling import ExtractionError
+from src.services import workflow_orchestrator
+
+_ALL_WORKFLOWS = tuple(WorkflowType)
+_EXPECTED_NAMES = frozenset(wf.value for wf in _ALL_WORKFLOWS)
+
+
+@pytest.fixture(scope="session")
+def shared_orchestrator():
+    """The orchestrator singleton, built once for the whole session."""
+    return WorkflowOrchestrator()
+
+
+@pytest.fixture
+def orchestrator(shared_orchestrator):
+    """The shared orchestrator, with handler ``execute`` methods restored after."""
+    handlers = shared_orchestrator.workflow_handlers
+    originals = {wf: handler.execute for wf, handler in handlers.items()}
+
+    yield shared_orchestrator
+
+    for wf, execute in originals.items():
+        handlers[wf].execute = execute
+
+
+@pytest.fixture
+def mock_get_workflow_type(monkeypatch):
+    """Replace workflow routing with a MagicMock the test can program."""
+    mock = MagicMock()
+    monkeypatch.setattr(workflow_orchestrator, "get_workflow_type", mock)
+    return mock
 
 
-@pytest.mark.asyncio
 class TestWorkflowOrchestrator:
     """Test cases for WorkflowOrchestrator."""
 
@@ -35,32 +64,24 @@ class TestWorkflowOrchestrator:
         assert orchestrator1 is orchestrator2
         assert isinstance(orchestrator1, WorkflowOrchestrator)
 
-    def test_initialization_creates_handlers(self):
+    def test_initialization_creates_handlers(self, orchestrator):
         """Test that initialization creates all handlers."""
-        orchestrator = WorkflowOrchestrator()
-
-        assert len(orchestrator.workflow_handlers) == 5
-        assert WorkflowType.TEXT_EXTRACTION in orchestrator.workflow_handlers
-        assert WorkflowType.MISTRAL in orchestrator.workflow_handlers
-        assert (
-            WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
-            in orchestrator.workflow_handlers
-        )
-        assert WorkflowType.OCR_WITH_IMAGES in orchestrator.workflow_handlers
-        assert WorkflowType.GEMINI in orchestrator.workflow_handlers
-
-    def test_get_handler_success(self):
+        assert set(orchestrator.workflow_handlers) == {
+            WorkflowType.TEXT_EXTRACTION,
+            WorkflowType.MISTRAL,
+            WorkflowType.AZURE_DOCUMENT_INTELLIGENCE,
+            WorkflowType.OCR_WITH_IMAGES,
+            WorkflowType.GEMINI,
+        }
+
+    def test_get_handler_success(self, orchestrator):
         """Test getting a specific handler."""
-        orchestrator = WorkflowOrchestrator()
-
         handler = orchestrator.get_handler(WorkflowType.MISTRAL)
         assert handler is not None
         assert handler.workflow_type == WorkflowType.MISTRAL
 
-    def test_get_handler_invalid(self):
+    def test_get_handler_invalid(self, orchestrator):
         """Test getting handler with invalid workflow type."""
-        orchestrator = WorkflowOrchestrator()
-
         # Create a fake enum value (this shouldn't normally happen)
         # We'll test with a string instead
         with pytest.raises(ValueError, match="Unknown workflow type"):
@@ -68,26 +89,19 @@ class TestWorkflowOrchestrator:
             # so we'll just verify the dict doesn't have unexpected keys
             orchestrator.get_handler("invalid")  # type: ignore
 
-    def test_list_workflows(self):
+    def test_list_workflows(self, orchestrator):
         """Test listing all available workflows."""
-        orchestrator = WorkflowOrchestrator()
-
         workflows = orchestrator.list_workflows()
 
         assert len(workflows) == 5
-        assert "text_extraction" in workflows
-        assert "mistral" in workflows
-        assert "azure_di" in workflows
-        assert "ocr_images" in workflows
-        assert "gemini" in workflows
-
-    @patch("src.services.workflow_orchestrator.get_workflow_type")
-    async def test_execute_workflow_with_routing(self, mock_get_workflow_type):
+        assert frozenset(workflows) == _EXPECTED_NAMES
+
+    async def test_execute_workflow_with_routing(
+        self, orchestrator, mock_get_workflow_type
+    ):
         """Test workflow execution with automatic routing."""
         mock_get_workflow_type.return_value = WorkflowType.MISTRAL
 
-        orchestrator = WorkflowOrchestrator()
-
         # Mock the handler's execute method
         mock_result = WorkflowResult(
             content="Test content",
@@ -106,15 +120,12 @@ class TestWorkflowOrchestrator:
         assert result.metadata["workflow"] == "mistral"
         mock_get_workflow_type.assert_called_once_with("extract data", None)
 
-    @patch("src.services.workflow_orchestrator.get_workflow_type")
     async def test_execute_workflow_with_explicit_workflow(
-        self, mock_get_workflow_type
+        self, orchestrator, mock_get_workflow_type
     ):
         """Test workflow execution with explicit workflow type."""
         mock_get_workflow_type.return_value = WorkflowType.GEMINI
 
-        orchestrator = WorkflowOrchestrator()
-
         # Mock the handler's execute method
         mock_result = WorkflowResult(
             content="Gemini content", metadata={"workflow": "gemini", "pages": 2}
@@ -132,13 +143,12 @@ class TestWorkflowOrchestrator:
         assert result.metadata["workflow"] == "gemini"
         mock_get_workflow_type.assert_called_once_with("extract", "gemini")
 
-    @patch("src.services.workflow_orchestrator.get_workflow_type")
-    async def test_execute_workflow_with_validation(self, mock_get_workflow_type):
+    async def test_execute_workflow_with_validation(
+        self, orchestrator, mock_get_workflow_type
+    ):
         """Test workflow execution with validation enabled."""
         mock_get_workflow_type.return_value = WorkflowType.MISTRAL
 
-        orchestrator = WorkflowOrchestrator()
-
         # Mock handler
         mock_result = WorkflowResult(
             content="Content",
@@ -163,13 +173,12 @@ class TestWorkflowOrchestrator:
         ].execute.call_args[1]
         assert call_kwargs["enable_validation"] is True
 
-    @patch("src.services.workflow_orchestrator.get_workflow_type")
-    async def test_execute_workflow_handler_error(self, mock_get_workflow_type):
+    async def test_execute_workflow_handler_error(
+        self, orchestrator, mock_get_workflow_type
+    ):
         """Test that handler errors are properly wrapped."""
         mock_get_workflow_type.return_value = WorkflowType.MISTRAL
 
-        orchestrator = WorkflowOrchestrator()
-
         # Mock handler to raise error
         orchestrator.workflow_handlers[WorkflowType.MISTRAL].execute = AsyncMock(
             side_effect=Exception("Handler failed")
@@ -181,27 +190,26 @@ class TestWorkflowOrchestrator:
                 pdf_path="/test/path.pdf", query="extract"
             )
 
-    @patch("src.services.workflow_orchestrator.get_workflow_type")
-    async def test_execute_workflow_all_types(self, mock_get_workflow_type):
-        """Test execution with all workflow types."""
-        orchestrator = WorkflowOrchestrator()
-
-        for workflow_type in WorkflowType:
-            mock_get_workflow_type.return_value = workflow_type
+    @pytest.mark.parametrize("workflow_type", _ALL_WORKFLOWS, ids=lambda t: t.value)
+    async def test_execute_workflow_for_type(
+        self, workflow_type, orchestrator, mock_get_workflow_type
+    ):
+        """Test execution with each workflow type."""
+        mock_get_workflow_type.return_value = workflow_type
 
-            # Mock handler
-            mock_result = WorkflowResult(
-                content=f"Content from {workflow_type.value}",
-                metadata={"workflow": workflow_type.value},
-            )
-            orchestrator.workflow_handlers[workflow_type].execute = AsyncMock(
-                return_value=mock_result
-            )
+        # Mock handler
+        mock_result = WorkflowResult(
+            content=f"Content from {workflow_type.value}",
+            metadata={"workflow": workflow_type.value},
+        )
+        orchestrator.workflow_handlers[workflow_type].execute = AsyncMock(
+            return_value=mock_result
+        )
 
-            # Execute
-            result = await orchestrator.execute_workflow(
-                pdf_path="/test/path.pdf", query="test query"
-            )
+        # Execute
+        result = await orchestrator.execute_workflow(
+            pdf_path="/test/path.pdf", query="test query"
+        )
 
-            assert result.content == f"Content from {workflow_type.value}"
-            assert result.metadata["workflow"] == workflow_type.value
+        assert result.content == f"Content from {workflow_type.value}"
+        assert result.metadata["workflow"] == workflow_type.value
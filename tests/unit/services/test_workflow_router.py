@@ -7,12 +7,19 @@ Tests the intelligent routing logic that selects workflows based on query keywor
 import pytest
 
 from src.services.workflow_router import (
+    _ROUTING_KEYWORDS,
     get_workflow_type,
     get_workflow_description,
     list_available_workflows,
 )
 from src.workflows.workflow_types import WorkflowType
 
+_KEYWORD_ROUTES = [
+    (keyword, workflow_type)
+    for workflow_type, keywords in _ROUTING_KEYWORDS.items()
+    for keyword in keywords
+]
+
 
 class TestWorkflowRouter:
     """Test cases for workflow routing."""
@@ -25,29 +32,34 @@ class TestWorkflowRouter:
         result = get_workflow_type(query="use azure di", explicit_workflow="mistral")
         assert result == WorkflowType.MISTRAL
 
+    def test_explicit_workflow_alias(self):
+        """Test that explicit workflow accepts aliases and stray case/whitespace."""
+        result = get_workflow_type(query="use gemini", explicit_workflow=" Azure ")
+        assert result == WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
+
     def test_explicit_workflow_invalid(self):
         """Test that invalid explicit workflow raises ValueError."""
         with pytest.raises(ValueError, match="Invalid workflow type"):
             get_workflow_type(query="test", explicit_workflow="invalid_workflow")
 
-    def test_text_extraction_routing(self):
-        """Test routing to text extraction workflow."""
-        queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "text extraction only",
             "use pdfplumber",
             "no ai please",
             "raw text extraction",
             "simple extraction",
             "plain text",
-        ]
-
-        for query in queries:
-            result = get_workflow_type(query)
-            assert result == WorkflowType.TEXT_EXTRACTION, f"Failed for query: {query}"
+        ],
+    )
+    def test_text_extraction_routing(self, query):
+        """Test routing to text extraction workflow."""
+        assert get_workflow_type(query) == WorkflowType.TEXT_EXTRACTION
 
-    def test_azure_di_routing(self):
-        """Test routing to Azure DI workflow."""
-        queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "use azure di",
             "extract with document intelligence",
             "smart tables",
@@ -55,17 +67,15 @@ class TestWorkflowRouter:
             "invoice extraction",
             "structured document",
             "preserve layout",
-        ]
-
-        for query in queries:
-            result = get_workflow_type(query)
-            assert (
-                result == WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
-            ), f"Failed for query: {query}"
+        ],
+    )
+    def test_azure_di_routing(self, query):
+        """Test routing to Azure DI workflow."""
+        assert get_workflow_type(query) == WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
 
-    def test_ocr_routing(self):
-        """Test routing to OCR workflow."""
-        queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "ocr this document",
             "extract images",
             "process charts",
@@ -73,39 +83,39 @@ class TestWorkflowRouter:
             "scanned document",
             "scan to text",
             "visual content",
-        ]
-
-        for query in queries:
-            result = get_workflow_type(query)
-            assert result == WorkflowType.OCR_WITH_IMAGES, f"Failed for query: {query}"
+        ],
+    )
+    def test_ocr_routing(self, query):
+        """Test routing to OCR workflow."""
+        assert get_workflow_type(query) == WorkflowType.OCR_WITH_IMAGES
 
-    def test_gemini_routing(self):
-        """Test routing to Gemini workflow."""
-        queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "use gemini",
             "google extraction",
             "high quality extraction",
             "best quality",
             "maximum quality",
-        ]
-
-        for query in queries:
-            result = get_workflow_type(query)
-            assert result == WorkflowType.GEMINI, f"Failed for query: {query}"
+        ],
+    )
+    def test_gemini_routing(self, query):
+        """Test routing to Gemini workflow."""
+        assert get_workflow_type(query) == WorkflowType.GEMINI
 
-    def test_mistral_default_routing(self):
-        """Test that Mistral is the default workflow."""
-        queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "extract all content",
             "get the data",
             "process this pdf",
             "",  # empty query
             "random query without keywords",
-        ]
-
-        for query in queries:
-            result = get_workflow_type(query)
-            assert result == WorkflowType.MISTRAL, f"Failed for query: {query}"
+        ],
+    )
+    def test_mistral_default_routing(self, query):
+        """Test that Mistral is the default workflow."""
+        assert get_workflow_type(query) == WorkflowType.MISTRAL
 
     def test_routing_priority_text_extraction(self):
         """Test that text extraction has highest priority."""
@@ -125,6 +135,19 @@ class TestWorkflowRouter:
         result = get_workflow_type("ocr with gemini")
         assert result == WorkflowType.OCR_WITH_IMAGES
 
+    def test_routing_priority_ignores_keyword_position(self):
+        """Test that priority, not keyword order in the query, decides routing."""
+        result = get_workflow_type("extract images with azure di")
+        assert result == WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
+
+        result = get_workflow_type("use gemini on the raw text")
+        assert result == WorkflowType.TEXT_EXTRACTION
+
+    @pytest.mark.parametrize("keyword,expected", _KEYWORD_ROUTES)
+    def test_every_keyword_routes(self, keyword, expected):
+        """Test that the compiled patterns match every configured keyword."""
+        assert get_workflow_type(f"please {keyword} now") == expected
+
     def test_routing_case_insensitive(self):
         """Test that routing is case insensitive."""
         assert get_workflow_type("USE GEMINI") == WorkflowType.GEMINI
@@ -89,6 +89,12 @@ class TestContentNormalizer:
         assert "brown" in terms
         assert "fox" not in terms  # Too short (< 5 chars)
 
+    def test_extract_key_terms_punctuation_and_underscores(self):
+        """Test that punctuation splits words and underscored words are skipped."""
+        text = "Total: 1,234 (NET)\tsnake_case REVENUE-growth"
+        terms = ContentNormalizer.extract_key_terms(text)
+        assert terms == {"total", "234", "net", "revenue", "growth"}
+
     def test_extract_key_terms_empty(self):
         """Test extracting from empty string."""
         assert ContentNormalizer.extract_key_terms("") == set()
@@ -101,6 +107,13 @@ class TestContentNormalizer:
         assert freq["bar"] == 2
         assert freq["baz"] == 1
 
+    def test_calculate_word_frequency_matches_key_terms(self):
+        """Test that counts are whole-word, case-insensitive and cover key terms."""
+        text = "Net: 100. NET net-income, netting, net_value; ok"
+        freq = ContentNormalizer.calculate_word_frequency(text)
+        assert freq == {"net": 3, "100": 1, "income": 1, "netting": 1}
+        assert freq.keys() == ContentNormalizer.extract_key_terms(text)
+
     def test_calculate_word_frequency_empty(self):
         """Test frequency calculation on empty string."""
         assert ContentNormalizer.calculate_word_frequency("") == {}
@@ -121,6 +134,11 @@ class TestContentNormalizer:
         assert "---PAGE BREAK---" not in result
         assert "[PAGE BREAK]" not in result
 
+    def test_remove_page_breaks_collapses_whitespace(self):
+        """Test that markers and surrounding whitespace collapse to one space."""
+        text = "  A\n---PAGE BREAK---\t\tB[PAGE BREAK]\u00a0C  "
+        assert ContentNormalizer.remove_page_breaks(text) == "A B C"
+
     def test_normalize_for_comparison(self):
         """Test full normalization for comparison."""
         text = "Hello, World!  ---PAGE-BREAK---  How are you?"
@@ -137,3 +155,15 @@ class TestContentNormalizer:
         assert "$" not in result
         assert "(" not in result
         assert ")" not in result
+
+    def test_normalize_for_comparison_page_break_after_punctuation(self):
+        """Test that a marker directly after punctuation is fully removed."""
+        text = "Total: 10.---PAGE BREAK---[PAGE BREAK]Next"
+        result = ContentNormalizer.normalize_for_comparison(text)
+        assert result == "total 10 next"
+
+    def test_normalize_for_comparison_non_ascii(self):
+        """Test that non-ASCII text is lowercased before stripping."""
+        text = "Caf\u00e9 \u00c9COLE,\n---PAGE-BREAK--- 10% \u212a"
+        result = ContentNormalizer.normalize_for_comparison(text)
+        assert result == "caf cole 10 k"
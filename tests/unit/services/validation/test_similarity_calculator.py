@@ -6,168 +6,200 @@ Tests similarity calculation methods.
 
 import pytest
 
-from src.services.validation.similarity_calculator import SimilarityCalculator
+from src.services.validation import similarity_calculator
+from src.services.validation.similarity_calculator import (
+    LEVENSHTEIN_REPORT_MAX_LENGTH,
+    REPORT_CACHE_MIN_LENGTH,
+    SimilarityCalculator,
+)
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    """One stateless SimilarityCalculator shared by every test in the module."""
+    return SimilarityCalculator()
+
+
+@pytest.fixture
+def report_cache():
+    """The module-level report cache, emptied before and after the test."""
+    similarity_calculator._report_cache.clear()
+    yield similarity_calculator._report_cache
+    similarity_calculator._report_cache.clear()
 
 
 class TestSimilarityCalculator:
     """Test cases for SimilarityCalculator."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.calculator = SimilarityCalculator()
-
-    def test_number_frequency_similarity_identical(self):
+    def test_number_frequency_similarity_identical(self, calculator):
         """Test number frequency similarity for identical texts."""
         text1 = "The values are 10, 20, 30"
         text2 = "The values are 10, 20, 30"
-        similarity = self.calculator._number_frequency_similarity(text1, text2)
+        similarity = calculator._number_frequency_similarity(text1, text2)
         assert similarity == pytest.approx(1.0)
 
-    def test_number_frequency_similarity_different(self):
+    def test_number_frequency_similarity_different(self, calculator):
         """Test number frequency similarity for different texts."""
         text1 = "The values are 10, 20, 30"
         text2 = "The values are 40, 50, 60"
-        similarity = self.calculator._number_frequency_similarity(text1, text2)
+        similarity = calculator._number_frequency_similarity(text1, text2)
         assert similarity == 0.0
 
-    def test_number_frequency_similarity_partial(self):
+    def test_number_frequency_similarity_partial(self, calculator):
         """Test number frequency similarity for partially overlapping texts."""
         text1 = "The values are 10, 20, 30"
         text2 = "The values are 10, 20, 40"
-        similarity = self.calculator._number_frequency_similarity(text1, text2)
+        similarity = calculator._number_frequency_similarity(text1, text2)
         assert 0.0 < similarity < 1.0
 
-    def test_number_frequency_similarity_both_empty(self):
+    def test_number_frequency_similarity_both_empty(self, calculator):
         """Test number frequency similarity when both texts have no numbers."""
         text1 = "No numbers here"
         text2 = "Also no numbers"
-        similarity = self.calculator._number_frequency_similarity(text1, text2)
+        similarity = calculator._number_frequency_similarity(text1, text2)
         assert similarity == pytest.approx(1.0)  # Both empty
 
-    def test_number_frequency_similarity_one_empty(self):
+    def test_number_frequency_similarity_one_empty(self, calculator):
         """Test number frequency similarity when one text has no numbers."""
         text1 = "Values: 10, 20, 30"
         text2 = "No numbers here"
-        similarity = self.calculator._number_frequency_similarity(text1, text2)
+        similarity = calculator._number_frequency_similarity(text1, text2)
         assert similarity == 0.0
 
-    def test_word_overlap_similarity_identical(self):
+    def test_word_overlap_similarity_identical(self, calculator):
         """Test word overlap similarity for identical texts."""
         text1 = "The quick brown fox"
         text2 = "The quick brown fox"
-        similarity = self.calculator._word_overlap_similarity(text1, text2)
+        similarity = calculator._word_overlap_similarity(text1, text2)
         assert similarity == pytest.approx(1.0)
 
-    def test_word_overlap_similarity_no_overlap(self):
+    def test_word_overlap_similarity_no_overlap(self, calculator):
         """Test word overlap similarity for texts with no overlap."""
         text1 = "The quick brown fox"
         text2 = "A lazy sleeping dog"
-        similarity = self.calculator._word_overlap_similarity(text1, text2)
+        similarity = calculator._word_overlap_similarity(text1, text2)
         assert similarity == 0.0
 
-    def test_word_overlap_similarity_partial(self):
+    def test_word_overlap_similarity_partial(self, calculator):
         """Test word overlap similarity for partial overlap."""
         text1 = "The quick brown fox"
         text2 = "The lazy brown dog"
-        similarity = self.calculator._word_overlap_similarity(text1, text2)
+        similarity = calculator._word_overlap_similarity(text1, text2)
         # "the" and "brown" overlap
         assert 0.0 < similarity < 1.0
 
-    def test_cosine_similarity_identical(self):
+    def test_cosine_similarity_identical(self, calculator):
         """Test cosine similarity for identical texts."""
         text1 = "Hello world hello"
         text2 = "Hello world hello"
-        similarity = self.calculator._cosine_similarity(text1, text2)
+        similarity = calculator._cosine_similarity(text1, text2)
         assert similarity == pytest.approx(1.0)
 
-    def test_cosine_similarity_no_overlap(self):
+    def test_cosine_similarity_no_overlap(self, calculator):
         """Test cosine similarity for texts with no overlap."""
         text1 = "Hello world"
         text2 = "Goodbye universe"
-        similarity = self.calculator._cosine_similarity(text1, text2)
+        similarity = calculator._cosine_similarity(text1, text2)
         assert similarity == 0.0
 
-    def test_levenshtein_distance_identical(self):
+    def test_levenshtein_distance_identical(self, calculator):
         """Test Levenshtein distance for identical strings."""
         s1 = "hello"
         s2 = "hello"
-        distance = self.calculator._levenshtein_distance(s1, s2)
+        distance = calculator._levenshtein_distance(s1, s2)
         assert distance == 0
 
-    def test_levenshtein_distance_one_edit(self):
+    def test_levenshtein_distance_one_edit(self, calculator):
         """Test Levenshtein distance with one character difference."""
         s1 = "hello"
         s2 = "hallo"
-        distance = self.calculator._levenshtein_distance(s1, s2)
+        distance = calculator._levenshtein_distance(s1, s2)
         assert distance == 1
 
-    def test_levenshtein_distance_empty(self):
+    def test_levenshtein_distance_empty(self, calculator):
         """Test Levenshtein distance with empty string."""
         s1 = "hello"
         s2 = ""
-        distance = self.calculator._levenshtein_distance(s1, s2)
+        distance = calculator._levenshtein_distance(s1, s2)
         assert distance == 5
 
-    def test_levenshtein_similarity_identical(self):
+    @pytest.mark.parametrize(
+        "s1,s2",
+        [
+            ("kitten", "sitting"),
+            ("", "abc"),
+            ("flaw", "lawn"),
+            ("the same text", "the same text"),
+            ("values 10 20 30", "values 10 20 40 50"),
+            ("aaab", "ab"),
+            ("page 1 total 5 end", "page 1 sum 5 end"),
+        ],
+    )
+    def test_levenshtein_distance_matches_dp(self, calculator, s1, s2):
+        """Test the native distance agrees with the pure-Python DP fallback."""
+        expected = calculator._levenshtein_distance_dp(s1, s2)
+        assert calculator._levenshtein_distance(s1, s2) == expected
+
+    def test_levenshtein_similarity_identical(self, calculator):
         """Test Levenshtein similarity for identical texts."""
         text1 = "hello world"
         text2 = "hello world"
-        similarity = self.calculator._levenshtein_similarity(text1, text2)
+        similarity = calculator._levenshtein_similarity(text1, text2)
         assert similarity == pytest.approx(1.0)
 
-    def test_levenshtein_similarity_different(self):
+    def test_levenshtein_similarity_different(self, calculator):
         """Test Levenshtein similarity for very different texts."""
         text1 = "aaaa"
         text2 = "bbbb"
-        similarity = self.calculator._levenshtein_similarity(text1, text2)
+        similarity = calculator._levenshtein_similarity(text1, text2)
         assert similarity == 0.0
 
-    def test_calculate_similarity_method_number_frequency(self):
+    def test_calculate_similarity_method_number_frequency(self, calculator):
         """Test calculate_similarity with number_frequency method."""
         text1 = "Values: 10, 20, 30"
         text2 = "Values: 10, 20, 30"
-        similarity = self.calculator.calculate_similarity(
+        similarity = calculator.calculate_similarity(
             text1, text2, method="number_frequency"
         )
         assert similarity == pytest.approx(1.0)
 
-    def test_calculate_similarity_method_word_overlap(self):
+    def test_calculate_similarity_method_word_overlap(self, calculator):
         """Test calculate_similarity with word_overlap method."""
         text1 = "hello world"
         text2 = "hello world"
-        similarity = self.calculator.calculate_similarity(
+        similarity = calculator.calculate_similarity(
             text1, text2, method="word_overlap"
         )
         assert similarity == pytest.approx(1.0)
 
-    def test_calculate_similarity_method_cosine(self):
+    def test_calculate_similarity_method_cosine(self, calculator):
         """Test calculate_similarity with cosine method."""
         text1 = "hello world"
         text2 = "hello world"
-        similarity = self.calculator.calculate_similarity(text1, text2, method="cosine")
+        similarity = calculator.calculate_similarity(text1, text2, method="cosine")
         assert similarity == pytest.approx(1.0)
 
-    def test_calculate_similarity_method_levenshtein(self):
+    def test_calculate_similarity_method_levenshtein(self, calculator):
         """Test calculate_similarity with levenshtein method."""
         text1 = "hello"
         text2 = "hello"
-        similarity = self.calculator.calculate_similarity(
+        similarity = calculator.calculate_similarity(
             text1, text2, method="levenshtein"
         )
         assert similarity == pytest.approx(1.0)
 
-    def test_calculate_similarity_invalid_method(self):
+    def test_calculate_similarity_invalid_method(self, calculator):
         """Test calculate_similarity with invalid method."""
         with pytest.raises(ValueError, match="Unknown similarity method"):
-            self.calculator.calculate_similarity(
+            calculator.calculate_similarity(
                 "text1", "text2", method="invalid_method"
             )
 
-    def test_calculate_similarity_report(self):
+    def test_calculate_similarity_report(self, calculator):
         """Test calculating similarity report with all methods."""
         text1 = "Values: 10, 20, 30. Hello world."
         text2 = "Values: 10, 20, 30. Hello world."
-        report = self.calculator.calculate_similarity_report(text1, text2)
+        report = calculator.calculate_similarity_report(text1, text2)
 
         assert "number_frequency" in report
         assert "word_overlap" in report
@@ -180,32 +212,77 @@ class TestSimilarityCalculator:
         assert report["cosine"] == pytest.approx(1.0)
         assert report["levenshtein"] == pytest.approx(1.0)
 
-    def test_calculate_similarity_report_long_text(self):
+    def test_calculate_similarity_report_long_text(self, calculator):
         """Test similarity report skips Levenshtein for long texts."""
-        text1 = "a" * 10000
-        text2 = "b" * 10000
-        report = self.calculator.calculate_similarity_report(text1, text2)
+        text1 = "a" * LEVENSHTEIN_REPORT_MAX_LENGTH
+        text2 = "b" * LEVENSHTEIN_REPORT_MAX_LENGTH
+        report = calculator.calculate_similarity_report(text1, text2)
 
         assert report["levenshtein"] is None  # Skipped for performance
 
-    def test_cosine_similarity_from_counters(self):
+    def test_calculate_similarity_report_cached(self, report_cache):
+        """Test that a repeated pair, in either order, reuses the cached report."""
+        calculator = SimilarityCalculator()
+        text1 = "Revenue 1,200 and costs 800. " * 20
+        text2 = "Revenue 1,250 and costs 800. " * 20
+        assert len(text1) >= REPORT_CACHE_MIN_LENGTH
+
+        report = calculator.calculate_similarity_report(text1, text2)
+        report["cosine"] = -1.0  # Callers can't alter the cached copy
+
+        calculator._similarity_report = None  # Any recomputation would fail
+        assert calculator.calculate_similarity_report(text2, text1)["cosine"] > 0
+        assert len(report_cache) == 1
+
+    def test_calculate_similarity_report_cache_shared(self, report_cache):
+        """Test that a new calculator reuses reports cached by another one."""
+        text1 = "Revenue 1,200 and costs 800. " * 20
+        text2 = "Revenue 1,250 and costs 800. " * 20
+        SimilarityCalculator().calculate_similarity_report(text1, text2)
+
+        calculator = SimilarityCalculator()
+        calculator._similarity_report = None  # Any recomputation would fail
+
+        assert calculator.calculate_similarity_report(text1, text2)["cosine"] > 0
+
+    def test_calculate_similarity_report_cache_bounded(
+        self, monkeypatch, report_cache
+    ):
+        """Test that the least recently used report is evicted when full."""
+        monkeypatch.setattr(similarity_calculator, "REPORT_CACHE_SIZE", 2)
+        calculator = SimilarityCalculator()
+        texts = [f"{n} " * REPORT_CACHE_MIN_LENGTH for n in range(3)]
+
+        for text in texts:
+            calculator.calculate_similarity_report(text, texts[0])
+
+        assert len(report_cache) == 2
+
+    def test_calculate_similarity_report_short_text_not_cached(self, report_cache):
+        """Test that short texts bypass the report cache."""
+        calculator = SimilarityCalculator()
+        calculator.calculate_similarity_report("short 1", "short 2")
+
+        assert len(report_cache) == 0
+
+    def test_cosine_similarity_from_counters(self, calculator):
         """Test cosine similarity calculation from counters."""
         from collections import Counter
 
         counter1 = Counter({"a": 2, "b": 1})
         counter2 = Counter({"a": 2, "b": 1})
-        similarity = self.calculator._cosine_similarity_from_counters(
+        similarity = calculator._cosine_similarity_from_counters(
             counter1, counter2
         )
         assert similarity == pytest.approx(1.0)
 
-    def test_cosine_similarity_from_counters_no_overlap(self):
+    def test_cosine_similarity_from_counters_no_overlap(self, calculator):
         """Test cosine similarity from counters with no overlap."""
         from collections import Counter
 
         counter1 = Counter({"a": 1, "b": 1})
         counter2 = Counter({"c": 1, "d": 1})
-        similarity = self.calculator._cosine_similarity_from_counters(
+        similarity = calculator._cosine_similarity_from_counters(
             counter1, counter2
         )
         assert similarity == 0.0
@@ -5,15 +5,25 @@ Tests the Mistral-based extraction workflow.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+from src.services.workflows import default_handler
 from src.services.workflows.default_handler import DefaultHandler
 from src.workflows.workflow_types import WorkflowType
 from src.models.workflow_models import ExtractedSection
 from src.core.error_handling import APIClientError, ExtractionError
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def mistral_factory(monkeypatch):
+    """Client factory with a prewired Mistral client, installed in the handler."""
+    factory = MagicMock()
+    factory.mistral = MagicMock(model="mistral-large")
+    factory.mistral.process_document = AsyncMock()
+    monkeypatch.setattr(default_handler, "get_client_factory", lambda: factory)
+    return factory
+
+
 class TestDefaultHandler:
     """Test cases for DefaultHandler."""
 
@@ -24,12 +34,9 @@ class TestDefaultHandler:
         assert handler.workflow_type == WorkflowType.MISTRAL
         assert isinstance(handler, DefaultHandler)
 
-    @patch("src.services.workflows.default_handler.get_client_factory")
-    async def test_execute_success(self, mock_get_factory):
+    async def test_execute_success(self, mistral_factory):
         """Test successful extraction with Mistral."""
-        # Mock Mistral client
-        mock_mistral_client = MagicMock()
-        mock_sections = [
+        mistral_factory.mistral.process_document.return_value = [
             ExtractedSection(
                 page_number=1,
                 content="Page 1 content",
@@ -41,13 +48,6 @@ class TestDefaultHandler:
                 metadata={"provider": "mistral"},
             ),
         ]
-        mock_mistral_client.process_document = AsyncMock(return_value=mock_sections)
-        mock_mistral_client.model = "mistral-large"
-
-        # Mock factory
-        mock_factory = MagicMock()
-        mock_factory.mistral = mock_mistral_client
-        mock_get_factory.return_value = mock_factory
 
         # Execute
         handler = DefaultHandler()
@@ -63,29 +63,16 @@ class TestDefaultHandler:
         assert len(result.sections) == 2
 
         # Verify client was called correctly
-        mock_mistral_client.process_document.assert_called_once_with(
+        mistral_factory.mistral.process_document.assert_called_once_with(
             pdf_path="/test/file.pdf", query="extract data"
         )
 
-    @patch("src.services.workflows.default_handler.settings")
-    @patch("src.services.workflows.default_handler.get_client_factory")
-    async def test_execute_with_validation_disabled(
-        self, mock_get_factory, mock_settings
-    ):
+    async def test_execute_with_validation_disabled(self, mistral_factory, monkeypatch):
         """Test execution with validation disabled."""
-        mock_settings.ENABLE_CROSS_VALIDATION = False
-
-        # Mock client
-        mock_mistral_client = MagicMock()
-        mock_sections = [
+        monkeypatch.setattr(default_handler.settings, "ENABLE_CROSS_VALIDATION", False)
+        mistral_factory.mistral.process_document.return_value = [
             ExtractedSection(page_number=1, content="Content", metadata={})
         ]
-        mock_mistral_client.process_document = AsyncMock(return_value=mock_sections)
-        mock_mistral_client.model = "mistral-large"
-
-        mock_factory = MagicMock()
-        mock_factory.mistral = mock_mistral_client
-        mock_get_factory.return_value = mock_factory
 
         # Execute
         handler = DefaultHandler()
@@ -95,25 +82,13 @@ class TestDefaultHandler:
         assert result.validation_report is None
         assert result.metadata["validation_enabled"] is False
 
-    @patch("src.services.workflows.default_handler.settings")
-    @patch("src.services.workflows.default_handler.get_client_factory")
-    async def test_execute_with_validation_enabled(
-        self, mock_get_factory, mock_settings
-    ):
+    async def test_execute_with_validation_enabled(self, mistral_factory, monkeypatch):
         """Test execution with validation enabled (not implemented yet)."""
-        mock_settings.ENABLE_CROSS_VALIDATION = False  # Default off
-
-        # Mock client
-        mock_mistral_client = MagicMock()
-        mock_sections = [
+        # Default off
+        monkeypatch.setattr(default_handler.settings, "ENABLE_CROSS_VALIDATION", False)
+        mistral_factory.mistral.process_document.return_value = [
             ExtractedSection(page_number=1, content="Content", metadata={})
         ]
-        mock_mistral_client.process_document = AsyncMock(return_value=mock_sections)
-        mock_mistral_client.model = "mistral-large"
-
-        mock_factory = MagicMock()
-        mock_factory.mistral = mock_mistral_client
-        mock_get_factory.return_value = mock_factory
 
         # Execute with explicit validation=True
         handler = DefaultHandler()
@@ -125,55 +100,31 @@ class TestDefaultHandler:
         assert result.validation_report is None
         assert result.metadata["validation_enabled"] is True
 
-    @patch("src.services.workflows.default_handler.get_client_factory")
-    async def test_execute_api_error(self, mock_get_factory):
+    async def test_execute_api_error(self, mistral_factory):
         """Test handling of API client errors."""
-        # Mock client to raise API error
-        mock_mistral_client = MagicMock()
-        mock_mistral_client.process_document = AsyncMock(
-            side_effect=APIClientError("API rate limit exceeded")
+        mistral_factory.mistral.process_document.side_effect = APIClientError(
+            "API rate limit exceeded"
         )
-        mock_mistral_client.model = "mistral-large"
-
-        mock_factory = MagicMock()
-        mock_factory.mistral = mock_mistral_client
-        mock_get_factory.return_value = mock_factory
 
         # Execute should propagate APIClientError
         handler = DefaultHandler()
         with pytest.raises(APIClientError, match="API rate limit exceeded"):
             await handler.execute(pdf_path="/test/file.pdf", query="extract")
 
-    @patch("src.services.workflows.default_handler.get_client_factory")
-    async def test_execute_generic_error(self, mock_get_factory):
+    async def test_execute_generic_error(self, mistral_factory):
         """Test handling of generic errors."""
-        # Mock client to raise generic error
-        mock_mistral_client = MagicMock()
-        mock_mistral_client.process_document = AsyncMock(
-            side_effect=Exception("Unexpected error")
+        mistral_factory.mistral.process_document.side_effect = Exception(
+            "Unexpected error"
         )
-        mock_mistral_client.model = "mistral-large"
-
-        mock_factory = MagicMock()
-        mock_factory.mistral = mock_mistral_client
-        mock_get_factory.return_value = mock_factory
 
         # Execute should wrap in ExtractionError
         handler = DefaultHandler()
         with pytest.raises(ExtractionError, match="Failed to process document"):
             await handler.execute(pdf_path="/test/file.pdf", query="extract")
 
-    @patch("src.services.workflows.default_handler.get_client_factory")
-    async def test_execute_empty_sections(self, mock_get_factory):
+    async def test_execute_empty_sections(self, mistral_factory):
         """Test execution when client returns empty sections."""
-        # Mock client with empty result
-        mock_mistral_client = MagicMock()
-        mock_mistral_client.process_document = AsyncMock(return_value=[])
-        mock_mistral_client.model = "mistral-large"
-
-        mock_factory = MagicMock()
-        mock_factory.mistral = mock_mistral_client
-        mock_get_factory.return_value = mock_factory
+        mistral_factory.mistral.process_document.return_value = []
 
         # Execute
         handler = DefaultHandler()
@@ -1,19 +1,133 @@
 """
 Unit tests for Text Extraction Handler.
 
-Tests the pdfplumber-based text extraction workflow.
+Tests the pdfplumber-based text extraction workflow and the optional PyMuPDF
+backend.
 """
 
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch, mock_open
-import pdfplumber
-
-from src.services.workflows.text_extraction_handler import TextExtractionHandler
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.services.workflows import text_extraction_handler
+from src.services.workflows.text_extraction_handler import (
+    TextExtractionHandler,
+)
 from src.workflows.workflow_types import WorkflowType
-from src.core.error_handling import ExtractionError
+from src.core.error_handling import ConfigurationError, ExtractionError
+
+pymupdf = text_extraction_handler.pymupdf
+
+requires_pymupdf = pytest.mark.skipif(
+    pymupdf is None, reason="PyMuPDF not installed"
+)
+
+
+def _make_page(text, tables=(), width=612, height=792):
+    """Build a pdfplumber-like page with canned text and tables."""
+    return SimpleNamespace(
+        extract_text=lambda: text,
+        extract_tables=lambda: [list(rows) for rows in tables],
+        width=width,
+        height=height,
+    )
+
+
+def _make_document(*pages):
+    """Build a pdfplumber-like document context manager over ``pages``."""
+    document = MagicMock()
+    document.pages = list(pages)
+    document.__enter__.return_value = document
+    return document
+
+
+def _make_pymupdf_page(text, tables=(), width=612, height=792):
+    """Build a PyMuPDF-like page with canned text and tables."""
+    found = SimpleNamespace(
+        tables=[
+            SimpleNamespace(extract=lambda rows=rows: rows) for rows in tables
+        ]
+    )
+    return SimpleNamespace(
+        get_text=lambda kind="text": text,
+        find_tables=lambda: found,
+        rect=SimpleNamespace(width=width, height=height),
+    )
+
+
+def _make_pymupdf_document(*pages):
+    """Build a PyMuPDF-like document context manager over ``pages``."""
+    document = MagicMock()
+    document.page_count = len(pages)
+    document.pages.side_effect = lambda start, stop: iter(pages[start:stop])
+    document.__enter__.return_value = document
+    return document
+
+
+def _write_pdf(path, texts):
+    """Write a minimal PDF with one page per entry in ``texts``.
+
+    Empty strings produce pages without text.
+    """
+    count = len(texts)
+    font_id = 3 + 2 * count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(b"%d 0 R" % (3 + 2 * i) for i in range(count))
+        + b"] /Count %d >>" % count,
+    ]
+    for i, text in enumerate(texts):
+        stream = (
+            b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode()
+            if text
+            else b""
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+            % (font_id, 4 + 2 * i)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    trailer = b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+    data += trailer % (len(objects) + 1, xref)
+    path.write_bytes(bytes(data))
+
+
+@pytest.fixture
+def extraction_pool():
+    """Shut down the shared worker pool once the test is done with it."""
+    yield
+    text_extraction_handler.shutdown_extraction_pool()
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    """Serve page ranges from a thread pool instead of worker processes."""
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(
+        text_extraction_handler, "_get_extraction_pool", lambda: pool
+    )
+    yield pool
+    pool.shutdown(wait=True)
 
 
-@pytest.mark.asyncio
 class TestTextExtractionHandler:
     """Test cases for TextExtractionHandler."""
 
@@ -28,28 +142,15 @@ class TestTextExtractionHandler:
     async def test_execute_success(self, mock_pdfplumber_open):
         """Test successful text extraction."""
         # Mock PDF with 2 pages
-        mock_page1 = MagicMock()
-        mock_page1.extract_text.return_value = "Page 1 content"
-        mock_page1.extract_tables.return_value = []
-        mock_page1.width = 612
-        mock_page1.height = 792
-
-        mock_page2 = MagicMock()
-        mock_page2.extract_text.return_value = "Page 2 content"
-        mock_page2.extract_tables.return_value = []
-        mock_page2.width = 612
-        mock_page2.height = 792
-
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-        mock_pdf.__exit__ = MagicMock(return_value=None)
-
-        mock_pdfplumber_open.return_value = mock_pdf
+        mock_pdfplumber_open.return_value = _make_document(
+            _make_page("Page 1 content"), _make_page("Page 2 content")
+        )
 
         # Execute
         handler = TextExtractionHandler()
-        result = await handler.execute(pdf_path="/test/file.pdf", query="extract text")
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract text"
+        )
 
         # Verify result
         assert "Page 1 content" in result.content
@@ -59,29 +160,32 @@ class TestTextExtractionHandler:
         assert result.metadata["provider"] == "pdfplumber"
         assert result.metadata["ai_used"] is False
         assert len(result.sections) == 2
+        assert result.sections[0].metadata["page_width"] == 612
+        assert result.sections[0].metadata["page_height"] == 792
+        mock_pdfplumber_open.assert_called_once_with("/test/file.pdf")
 
     @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
     async def test_execute_with_tables(self, mock_pdfplumber_open):
         """Test extraction with tables."""
         # Mock page with table
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = "Page text"
-        mock_page.extract_tables.return_value = [
-            [["Header1", "Header2"], ["Row1Col1", "Row1Col2"], ["Row2Col1", "Row2Col2"]]
-        ]
-        mock_page.width = 612
-        mock_page.height = 792
-
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page]
-        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-        mock_pdf.__exit__ = MagicMock(return_value=None)
-
-        mock_pdfplumber_open.return_value = mock_pdf
+        mock_pdfplumber_open.return_value = _make_document(
+            _make_page(
+                "Page text",
+                tables=[
+                    [
+                        ["Header1", "Header2"],
+                        ["Row1Col1", "Row1Col2"],
+                        ["Row2Col1", "Row2Col2"],
+                    ]
+                ],
+            )
+        )
 
         # Execute
         handler = TextExtractionHandler()
-        result = await handler.execute(pdf_path="/test/file.pdf", query="extract")
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract"
+        )
 
         # Verify table was included
         assert "Page text" in result.content
@@ -90,29 +194,87 @@ class TestTextExtractionHandler:
         assert result.sections[0].metadata["has_tables"] is True
 
     @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
-    async def test_execute_empty_page(self, mock_pdfplumber_open):
-        """Test extraction from empty page."""
-        # Mock empty page
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = None  # pdfplumber returns None for empty
-        mock_page.extract_tables.return_value = []
-        mock_page.width = 612
-        mock_page.height = 792
+    async def test_execute_tables_disabled(self, mock_pdfplumber_open):
+        """Test that table detection is skipped when disabled."""
+        page = _make_page("Page text", tables=[[["Header1", "Header2"]]])
+        page.extract_tables = MagicMock(wraps=page.extract_tables)
+        mock_pdfplumber_open.return_value = _make_document(page)
+
+        handler = TextExtractionHandler()
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract", detect_tables=False
+        )
+
+        page.extract_tables.assert_not_called()
+        assert result.content == "Page text"
+        assert result.sections[0].metadata["has_tables"] is False
+        assert result.metadata["tables_scanned"] is False
+
+    @pytest.mark.parametrize(
+        "query",
+        ["extract plain text", "Raw text only, no tables", "extract", ""],
+    )
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_tables_detected_whatever_the_query(
+        self, mock_pdfplumber_open, query
+    ):
+        """Test that the query never turns table detection off."""
+        page = _make_page("Page text")
+        page.extract_tables = MagicMock(wraps=page.extract_tables)
+        mock_pdfplumber_open.return_value = _make_document(page)
+
+        handler = TextExtractionHandler()
+        result = await handler.execute(pdf_path="/test/file.pdf", query=query)
+
+        page.extract_tables.assert_called_once_with()
+        assert result.metadata["tables_scanned"] is True
+
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_tables_disabled_by_settings(
+        self, mock_pdfplumber_open, monkeypatch
+    ):
+        """Test that the setting applies when no flag is passed."""
+        monkeypatch.setattr(
+            text_extraction_handler.settings,
+            "TEXT_EXTRACTION_DETECT_TABLES",
+            False,
+        )
+        page = _make_page("Page text", tables=[[["Header1", "Header2"]]])
+        page.extract_tables = MagicMock(wraps=page.extract_tables)
+        mock_pdfplumber_open.return_value = _make_document(page)
+
+        handler = TextExtractionHandler()
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract"
+        )
 
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page]
-        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-        mock_pdf.__exit__ = MagicMock(return_value=None)
+        page.extract_tables.assert_not_called()
+        assert result.metadata["tables_scanned"] is False
 
-        mock_pdfplumber_open.return_value = mock_pdf
+        # An explicit flag still wins over the setting
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract", detect_tables=True
+        )
+
+        assert result.metadata["tables_scanned"] is True
+        page.extract_tables.assert_called_once_with()
+
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_empty_page(self, mock_pdfplumber_open):
+        """Test extraction from empty page."""
+        # pdfplumber returns None for a page without text
+        mock_pdfplumber_open.return_value = _make_document(_make_page(None))
 
         # Execute
         handler = TextExtractionHandler()
-        result = await handler.execute(pdf_path="/test/file.pdf", query="extract")
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract"
+        )
 
         # Should handle empty page gracefully
         assert result.content == ""  # Empty string
         assert result.sections[0].content == ""
+        assert result.sections[0].metadata["has_tables"] is False
 
     @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
     async def test_execute_file_not_found(self, mock_pdfplumber_open):
@@ -122,7 +284,9 @@ class TestTextExtractionHandler:
         handler = TextExtractionHandler()
 
         with pytest.raises(ExtractionError, match="PDF file not found"):
-            await handler.execute(pdf_path="/missing/file.pdf", query="extract")
+            await handler.execute(
+                pdf_path="/missing/file.pdf", query="extract"
+            )
 
     @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
     async def test_execute_pdf_read_error(self, mock_pdfplumber_open):
@@ -132,7 +296,252 @@ class TestTextExtractionHandler:
         handler = TextExtractionHandler()
 
         with pytest.raises(ExtractionError, match="Failed to read PDF"):
-            await handler.execute(pdf_path="/test/corrupted.pdf", query="extract")
+            await handler.execute(
+                pdf_path="/test/corrupted.pdf", query="extract"
+            )
+
+    async def test_execute_real_pdf(self, tmp_path):
+        """Test extraction end to end on a real PDF file."""
+        pdf_path = tmp_path / "sample.pdf"
+        _write_pdf(pdf_path, ["Hello from page one", ""])
+
+        handler = TextExtractionHandler()
+        result = await handler.execute(pdf_path=str(pdf_path), query="extract")
+
+        assert result.metadata["pages"] == 2
+        assert result.sections[0].content.strip() == "Hello from page one"
+        assert result.sections[1].content == ""
+
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_streams_pages(
+        self, mock_pdfplumber_open, monkeypatch
+    ):
+        """Test that each page is formatted before the next one is read."""
+        events = []
+        pages = []
+        for n in range(1, 6):
+            page = _make_page("text", tables=[[["cell"]]])
+            page.extract_text = lambda n=n: events.append(n) or "text"
+            pages.append(page)
+        mock_pdfplumber_open.return_value = _make_document(*pages)
+
+        handler = TextExtractionHandler()
+        format_tables = handler._format_tables
+
+        def record_format(tables):
+            events.append("format")
+            return format_tables(tables)
+
+        monkeypatch.setattr(handler, "_format_tables", record_format)
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract"
+        )
+
+        assert events == [
+            event for n in range(1, 6) for event in (n, "format")
+        ]
+        assert len(result.sections) == 5
+
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_reads_off_event_loop(self, mock_pdfplumber_open):
+        """Test that the document is opened, read and closed in one thread."""
+        threads = []
+        pages = []
+        for n in range(1, 4):
+            page = _make_page(f"page {n}")
+            page.extract_text = (
+                lambda n=n: threads.append(threading.get_ident())
+                or f"page {n}"
+            )
+            pages.append(page)
+        document = _make_document(*pages)
+        document.__exit__.side_effect = lambda *exc: threads.append(
+            threading.get_ident()
+        )
+        mock_pdfplumber_open.side_effect = lambda path: (
+            threads.append(threading.get_ident()) or document
+        )
+
+        handler = TextExtractionHandler()
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract"
+        )
+
+        assert len(threads) == 5  # open, three pages, close
+        assert len(set(threads)) == 1
+        assert threads[0] != threading.get_ident()
+        assert [s.content for s in result.sections] == [
+            "page 1",
+            "page 2",
+            "page 3",
+        ]
+
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_cancelled_closes_after_read(
+        self, mock_pdfplumber_open
+    ):
+        """Test that cancelling doesn't close the document mid-read."""
+        reading = threading.Event()
+        release = threading.Event()
+        closed = threading.Event()
+        events = []
+
+        def extract_text():
+            reading.set()
+            release.wait(5)
+            events.append("read")
+            return "text"
+
+        page = _make_page("text")
+        page.extract_text = extract_text
+        document = _make_document(page)
+        document.__exit__.side_effect = lambda *exc: (
+            events.append("close") or closed.set()
+        )
+        mock_pdfplumber_open.return_value = document
+
+        handler = TextExtractionHandler()
+        task = asyncio.ensure_future(
+            handler.execute(pdf_path="/test/file.pdf", query="extract")
+        )
+        assert await asyncio.to_thread(reading.wait, 5)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert events == []
+        release.set()
+        assert await asyncio.to_thread(closed.wait, 5)
+        assert events == ["read", "close"]
+
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_parallel_order_preserved(
+        self, mock_pdfplumber_open, monkeypatch, thread_pool
+    ):
+        """Test that page order holds when later ranges finish first."""
+        mock_pdfplumber_open.return_value = _make_document(
+            *[_make_page("")] * 32
+        )
+        monkeypatch.setattr(
+            text_extraction_handler, "MAX_EXTRACTION_WORKERS", 4
+        )
+        ranges = []
+
+        def read_page_range(backend, pdf_path, start, stop, detect_tables):
+            ranges.append((start, stop))
+            time.sleep((32 - start) / 1000)  # Earlier ranges finish last
+            return [
+                (f"page {n}", [], 612, 792) for n in range(start + 1, stop + 1)
+            ]
+
+        monkeypatch.setattr(
+            text_extraction_handler, "_read_page_range", read_page_range
+        )
+
+        handler = TextExtractionHandler()
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract"
+        )
+
+        assert sorted(ranges) == [(0, 8), (8, 16), (16, 24), (24, 32)]
+        assert [s.content for s in result.sections] == [
+            f"page {n}" for n in range(1, 33)
+        ]
+        assert [s.page_number for s in result.sections] == list(range(1, 33))
+
+    @patch("src.services.workflows.text_extraction_handler.pdfplumber.open")
+    async def test_execute_parallel_failure_cancels_queued_ranges(
+        self, mock_pdfplumber_open, monkeypatch
+    ):
+        """Test that ranges not yet started are cancelled when one fails."""
+        mock_pdfplumber_open.return_value = _make_document(
+            *[_make_page("")] * 32
+        )
+        monkeypatch.setattr(
+            text_extraction_handler, "MAX_EXTRACTION_WORKERS", 4
+        )
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(
+            text_extraction_handler, "_get_extraction_pool", lambda: pool
+        )
+        release = threading.Event()
+        started = []
+
+        def read_page_range(backend, pdf_path, start, stop, detect_tables):
+            started.append(start)
+            if start == 0:
+                raise RuntimeError("Corrupted page")
+            release.wait(
+                5
+            )  # Holds the only worker so later ranges stay queued
+            return []
+
+        monkeypatch.setattr(
+            text_extraction_handler, "_read_page_range", read_page_range
+        )
+
+        handler = TextExtractionHandler()
+        try:
+            with pytest.raises(ExtractionError, match="Corrupted page"):
+                await handler.execute(
+                    pdf_path="/test/file.pdf", query="extract"
+                )
+        finally:
+            release.set()
+            pool.shutdown(wait=True)
+
+        # Range 8 may have been picked up before the failure was seen, but the
+        # worker was busy with it until released, so later ranges never ran
+        assert started in ([0], [0, 8])
+
+    def test_extraction_pool_shared_and_bounded(self, extraction_pool):
+        """Test that one bounded, non-fork worker pool serves all requests."""
+        pool = text_extraction_handler._get_extraction_pool()
+
+        assert text_extraction_handler._get_extraction_pool() is pool
+        assert (
+            pool._max_workers == text_extraction_handler.MAX_EXTRACTION_WORKERS
+        )
+        assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+        text_extraction_handler.shutdown_extraction_pool()
+
+        assert text_extraction_handler._extraction_pool is None
+        assert text_extraction_handler._get_extraction_pool() is not pool
+
+    async def test_execute_real_pdf_parallel(
+        self, tmp_path, monkeypatch, extraction_pool
+    ):
+        """Test that worker processes read a real multi-range PDF in order."""
+        monkeypatch.setattr(
+            text_extraction_handler, "MAX_EXTRACTION_WORKERS", 2
+        )
+        pdf_path = tmp_path / "long.pdf"
+        _write_pdf(pdf_path, [f"Page number {n}" for n in range(1, 21)])
+
+        handler = TextExtractionHandler()
+        result = await handler.execute(pdf_path=str(pdf_path), query="extract")
+
+        assert result.metadata["pages"] == 20
+        assert [s.content.strip() for s in result.sections] == [
+            f"Page number {n}" for n in range(1, 21)
+        ]
+
+    def test_initialization_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(
+            ConfigurationError, match="Unknown text extraction backend"
+        ):
+            TextExtractionHandler(backend="pypdf")
+
+    def test_initialization_pymupdf_missing(self, monkeypatch):
+        """Test fallback to pdfplumber when PyMuPDF is not installed."""
+        monkeypatch.setattr(text_extraction_handler, "pymupdf", None)
+
+        handler = TextExtractionHandler(backend="pymupdf")
+
+        assert handler.backend == "pdfplumber"
 
     def test_format_tables_empty(self):
         """Test table formatting with empty input."""
@@ -181,3 +590,59 @@ class TestTextExtractionHandler:
 
         assert "TABLE 1:" in result
         assert "A |  | C" in result  # Empty string for None
+
+
+@requires_pymupdf
+class TestTextExtractionHandlerPyMuPDF:
+    """Test cases for the optional PyMuPDF backend."""
+
+    def test_initialization(self):
+        """Test selecting the PyMuPDF backend."""
+        handler = TextExtractionHandler(backend="pymupdf")
+
+        assert handler.backend == "pymupdf"
+
+    @patch("src.services.workflows.text_extraction_handler.pymupdf.open")
+    async def test_execute_with_tables(self, mock_pymupdf_open):
+        """Test extraction with tables through PyMuPDF."""
+        mock_pymupdf_open.return_value = _make_pymupdf_document(
+            _make_pymupdf_page(
+                "Page 1 content", tables=[[["A", "B"], ["1", "2"]]]
+            ),
+            _make_pymupdf_page("Page 2 content"),
+        )
+
+        handler = TextExtractionHandler(backend="pymupdf")
+        result = await handler.execute(
+            pdf_path="/test/file.pdf", query="extract"
+        )
+
+        assert result.metadata["provider"] == "pymupdf"
+        assert result.metadata["pages"] == 2
+        assert "TABLE 1:\nA | B\n1 | 2" in result.sections[0].content
+        assert result.sections[1].content == "Page 2 content"
+        assert result.sections[0].metadata["page_width"] == 612
+
+    @patch("src.services.workflows.text_extraction_handler.pymupdf.open")
+    async def test_execute_file_not_found(self, mock_pymupdf_open):
+        """Test that PyMuPDF's own missing-file error is reported as such."""
+        mock_pymupdf_open.side_effect = pymupdf.FileNotFoundError("no file")
+
+        handler = TextExtractionHandler(backend="pymupdf")
+
+        with pytest.raises(ExtractionError, match="PDF file not found"):
+            await handler.execute(
+                pdf_path="/missing/file.pdf", query="extract"
+            )
+
+    async def test_execute_real_pdf(self, tmp_path):
+        """Test PyMuPDF extraction end to end on a real PDF file."""
+        pdf_path = tmp_path / "sample.pdf"
+        _write_pdf(pdf_path, ["Hello from page one", ""])
+
+        handler = TextExtractionHandler(backend="pymupdf")
+        result = await handler.execute(pdf_path=str(pdf_path), query="extract")
+
+        assert result.metadata["pages"] == 2
+        assert result.sections[0].content.strip() == "Hello from page one"
+        assert result.sections[1].content == ""
@@ -24,13 +24,17 @@ class TestWorkflowType:
         """Test conversion from exact string match."""
         assert WorkflowType.from_string("mistral") == WorkflowType.MISTRAL
         assert (
-            WorkflowType.from_string("text_extraction") == WorkflowType.TEXT_EXTRACTION
+            WorkflowType.from_string("text_extraction")
+            == WorkflowType.TEXT_EXTRACTION
         )
         assert (
             WorkflowType.from_string("azure_di")
             == WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
         )
-        assert WorkflowType.from_string("ocr_images") == WorkflowType.OCR_WITH_IMAGES
+        assert (
+            WorkflowType.from_string("ocr_images")
+            == WorkflowType.OCR_WITH_IMAGES
+        )
         assert WorkflowType.from_string("gemini") == WorkflowType.GEMINI
 
     def test_from_string_case_insensitive(self):
@@ -72,6 +76,12 @@ class TestWorkflowType:
         assert str(WorkflowType.GEMINI) == "gemini"
         assert str(WorkflowType.TEXT_EXTRACTION) == "text_extraction"
 
+    def test_str_and_format_match_value(self):
+        """Test that str() and f-strings give the value for every member."""
+        for workflow_type in WorkflowType:
+            assert str(workflow_type) == workflow_type.value
+            assert f"{workflow_type}" == workflow_type.value
+
     def test_all_workflow_types_count(self):
         """Test that we have exactly 5 workflow types."""
         all_types = list(WorkflowType)